@@ -3,25 +3,60 @@
 
 import pygame
 import random
-from constants import CARD_DIMENSIONS, ASSETS
+from collections import OrderedDict
+from constants import CARD_DIMENSIONS, ASSET_THEMES, DEFAULT_THEME, ASSET_CACHE_SIZE
+from card_codes import code_from_type
+from atlas import load_atlas
 
 class AssetManager:
-    def __init__(self):
+    def __init__(self, theme=DEFAULT_THEME, lazy=False, cache_size=ASSET_CACHE_SIZE):
+        self.lazy = lazy
+        self.cache_size = cache_size
         self.assets = {}
-        self.load_assets()
+        # Lazy mode: (theme, name) -> surface, least recently used first
+        self.cache = OrderedDict()
+        self.source = None  # 'atlas' or 'files': where eager loading got the theme from
+        self.placeholder = self.create_placeholder()
+        self.set_theme(theme)
+    
+    def set_theme(self, theme):
+        """Switch deck theme; eager mode reloads, lazy mode loads faces as they are drawn"""
+        self.theme = theme
+        self.theme_assets = ASSET_THEMES[theme]
+        # Keys of the 52 real cards, built once for random picks
+        self.card_keys = [name for name in self.theme_assets if code_from_type(name) is not None]
+        if not self.lazy:
+            self.assets = {}
+            self.load_assets()
     
     def load_assets(self):
-        """Load and scale all game assets"""
-        for name, path in ASSETS.items():
-            try:
-                asset = pygame.image.load(path)
-                scaled_asset = pygame.transform.scale(asset, CARD_DIMENSIONS)
-                self.assets[name] = scaled_asset
-                print(f"Loaded {name} asset: {asset.get_width()}x{asset.get_height()}")
-            except pygame.error as e:
-                print(f"Error loading asset {name}: {e}")
-                # Create a placeholder surface if asset fails to load
-                self.assets[name] = self.create_placeholder()
+        """Load all assets of the theme, from the prebuilt atlas when it is up to date"""
+        atlas_assets = load_atlas(assets=self.theme_assets)
+        if atlas_assets is not None:
+            self.assets.update(atlas_assets)
+            self.source = 'atlas'
+            print(f"Loaded {len(atlas_assets)} assets from atlas")
+            return
+        
+        for name in self.theme_assets:
+            self.assets[name] = self.load_asset(name)
+        self.source = 'files'
+        print(f"Loaded {len(self.assets)} assets (run `python atlas.py` to build an atlas)")
+    
+    def load_asset(self, name):
+        """Load and scale one asset of the current theme"""
+        path = self.theme_assets.get(name)
+        if path is None:
+            return self.placeholder
+        try:
+            asset = pygame.transform.scale(pygame.image.load(path), CARD_DIMENSIONS)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading asset {name}: {e}")
+            # Use the shared placeholder surface if asset fails to load
+            return self.placeholder
+        if pygame.display.get_surface() is not None:
+            asset = asset.convert_alpha()
+        return asset
     
     def create_placeholder(self):
         """Create a placeholder surface for missing assets"""
@@ -31,9 +66,21 @@ class AssetManager:
     
     def get_asset(self, name):
         """Get an asset by name"""
-        return self.assets.get(name, self.create_placeholder())
+        if not self.lazy:
+            return self.assets.get(name, self.placeholder)
+        
+        key = (self.theme, name)
+        asset = self.cache.get(key)
+        if asset is not None:
+            self.cache.move_to_end(key)
+            return asset
+        
+        asset = self.load_asset(name)
+        self.cache[key] = asset
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)  # Evict the least recently used face
+        return asset
     
     def get_random_asset_key(self):
-        random_id = random.randint(2, 53)
-        keys = list(self.assets.keys())
-        return keys[random_id]
\ No newline at end of file
+        """Pick any card key (with replacement); use a Deck to deal without"""
+        return random.choice(self.card_keys)
\ No newline at end of file
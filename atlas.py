@@ -0,0 +1,82 @@
+# atlas.py
+"""Texture atlas: every scaled card face packed into one image plus an index"""
+
+import json
+import os
+import pygame
+from constants import CARD_DIMENSIONS, ASSETS, ATLAS_IMAGE, ATLAS_INDEX, ATLAS_COLUMNS
+
+PLACEHOLDER_COLOR = (100, 100, 100)
+
+
+def source_stamps(assets=ASSETS):
+    """(mtime_ns, size) of every source file, None when missing, so edited PNGs invalidate the atlas"""
+    stamps = {}
+    for path in assets.values():
+        try:
+            stat = os.stat(path)
+            stamps[path] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def build_atlas(image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX, assets=ASSETS):
+    """Scale every asset to CARD_DIMENSIONS and pack them into one atlas"""
+    width, height = CARD_DIMENSIONS
+    rows = (len(assets) + ATLAS_COLUMNS - 1) // ATLAS_COLUMNS
+    atlas = pygame.Surface((width * ATLAS_COLUMNS, height * rows), pygame.SRCALPHA)
+
+    frames = {}
+    for i, (name, path) in enumerate(assets.items()):
+        x = (i % ATLAS_COLUMNS) * width
+        y = (i // ATLAS_COLUMNS) * height
+        try:
+            face = pygame.transform.scale(pygame.image.load(path), CARD_DIMENSIONS)
+            atlas.blit(face, (x, y))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading asset {name}: {e}")
+            atlas.fill(PLACEHOLDER_COLOR, (x, y, width, height))
+        frames[name] = [x, y, width, height]
+
+    pygame.image.save(atlas, image_path)
+    index = {
+        'card_dimensions': list(CARD_DIMENSIONS),
+        'sources': dict(assets),
+        'stamps': source_stamps(assets),
+        'frames': frames,
+    }
+    with open(index_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    print(f"Built {len(frames)}-card atlas {atlas.get_width()}x{atlas.get_height()}: {image_path}")
+
+
+def load_atlas(image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX, assets=ASSETS):
+    """
+    Load the atlas and cut it into per-card subsurfaces
+    Returns: {name: Surface}, or None when the atlas is missing or out of date
+    """
+    if not (os.path.exists(image_path) and os.path.exists(index_path)):
+        return None
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('card_dimensions') != list(CARD_DIMENSIONS) or index.get('sources') != dict(assets):
+        return None
+    if index.get('stamps') != source_stamps(assets):
+        return None  # A source PNG was re-keyed or replaced since the build
+
+    try:
+        atlas = pygame.image.load(image_path)
+    except (pygame.error, FileNotFoundError):
+        return None
+    # Convert once for fast blits; subsurfaces share the converted pixels
+    if pygame.display.get_surface() is not None:
+        atlas = atlas.convert_alpha()
+    return {name: atlas.subsurface(pygame.Rect(frame)) for name, frame in index['frames'].items()}
+
+
+if __name__ == "__main__":
+    build_atlas()
@@ -0,0 +1,57 @@
+# batch_evaluator.py
+"""Vectorized NumPy hand strength for millions of hands at once"""
+
+import numpy as np
+from card_codes import NUM_CARDS, RANK_PRIMES
+from lookup_evaluator import RANK_STRENGTH, FLUSH_STRENGTH, CATEGORY_SHIFT
+
+# Array forms of the lookup_evaluator tables; non-flush products are sorted
+# so a whole column of products resolves with one searchsorted call
+_PRIMES = np.array(RANK_PRIMES, dtype=np.int64)
+_FLUSH = np.array(FLUSH_STRENGTH, dtype=np.int32)
+_PRODUCTS = np.array(sorted(RANK_STRENGTH), dtype=np.int64)
+_STRENGTHS = np.array([RANK_STRENGTH[product] for product in _PRODUCTS.tolist()], dtype=np.int32)
+
+
+def evaluate_codes(cards):
+    """
+    Evaluate an (N, 5-7) array of card codes
+    Returns: (N,) int32 array of strengths comparable with lookup_evaluator.evaluate
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError(f"Expected an (N, 5-7) array of card codes, got shape {cards.shape}")
+    if cards.size and (cards.min() < 0 or cards.max() >= NUM_CARDS):
+        raise ValueError("Card codes must be in the range 0-51")
+
+    cards = cards.astype(np.int32, copy=False)
+    ranks = cards >> 2
+    suits = cards & 3
+
+    products = _PRIMES[ranks].prod(axis=1)
+    index = np.searchsorted(_PRODUCTS, products)
+    index[index == len(_PRODUCTS)] = 0
+    if not np.array_equal(_PRODUCTS[index], products):
+        raise ValueError("Hands must not contain more than four cards of a rank")
+    strengths = _STRENGTHS[index]
+
+    rank_bits = np.left_shift(1, ranks)
+    for suit in range(4):
+        masks = np.bitwise_or.reduce(np.where(suits == suit, rank_bits, 0), axis=1)
+        np.maximum(strengths, _FLUSH[masks], out=strengths)
+    return strengths
+
+
+def evaluate_batch(hole_cards, board):
+    """
+    Evaluate (N, 2) hole cards against (N, 3-5) boards
+    Returns: ((N,) strengths, (N,) HandRank values as int8)
+    """
+    hole_cards = np.asarray(hole_cards)
+    board = np.asarray(board)
+    if hole_cards.ndim != 2 or board.ndim != 2 or len(hole_cards) != len(board):
+        raise ValueError(f"Hole cards {hole_cards.shape} and board {board.shape} must be (N, k) arrays of equal length")
+
+    strengths = evaluate_codes(np.concatenate((hole_cards, board), axis=1))
+    categories = (strengths >> CATEGORY_SHIFT).astype(np.int8)
+    return strengths, categories
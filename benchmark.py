@@ -0,0 +1,292 @@
+# benchmark.py
+"""Reproducible benchmarks for evaluation, showdown, dealing, assets and rendering"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from card import Card
+from card_codes import type_from_code
+from deck import Deck
+from hand_evaluator import HandEvaluator
+from players import Players
+
+DEFAULT_SEED = 1234
+DEFAULT_REPEAT = 20
+DEFAULT_THRESHOLD = 10.0  # Percent slowdown that counts as a regression
+
+
+class SkipBenchmark(Exception):
+    """Raised by a setup function when an optional dependency is missing"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def measure(operation, number, repeat):
+    """
+    Time `repeat` batches of `number` calls, timing every call on its own
+    Returns: dict with ops/sec and per-call latency percentiles in microseconds
+    (each call's time includes one perf_counter read, roughly 0.1 us)
+    """
+    operation()  # Warm up caches and lazy imports
+    timer = time.perf_counter
+    per_call = []
+    total_time = 0.0
+    for _ in range(repeat):
+        batch_start = last = timer()
+        for _ in range(number):
+            operation()
+            now = timer()
+            per_call.append(now - last)
+            last = now
+        total_time += last - batch_start
+    per_call = [elapsed * 1e6 for elapsed in per_call]
+    return {
+        'ops_per_sec': number * repeat / total_time if total_time else 0.0,
+        'p50_us': percentile(per_call, 50),
+        'p90_us': percentile(per_call, 90),
+        'p99_us': percentile(per_call, 99),
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def _random_cards(rng, count):
+    return [Card(0, 0, None, type_from_code(code)) for code in rng.sample(range(52), count)]
+
+
+def _cycle(items):
+    """Endless iterator over prepared inputs, so every call sees different cards"""
+    while True:
+        for item in items:
+            yield item
+
+
+def bench_evaluate(num_cards):
+    def setup(seed):
+        rng = random.Random(seed)
+        evaluator = HandEvaluator()
+        hands = _cycle([_random_cards(rng, num_cards) for _ in range(1000)])
+
+        def operation():
+            cards = next(hands)
+            evaluator.evaluate_hand(cards[:2], cards[2:])
+        return operation, 2000
+    return setup
+
+
+def bench_compare_hands(seed):
+    rng = random.Random(seed)
+    evaluator = HandEvaluator()
+    results = []
+    for _ in range(1000):
+        cards = _random_cards(rng, 7)
+        results.append(evaluator.evaluate_hand(cards[:2], cards[2:]))
+    pairs = _cycle(list(zip(results, results[1:] + results[:1])))
+
+    def operation():
+        first, second = next(pairs)
+        evaluator.compare_hands(first, second)
+    return operation, 5000
+
+
+def bench_find_winners(num_players):
+    def setup(seed):
+        rng = random.Random(seed)
+        deck = Deck(rng)
+        players = Players(None, deck=Deck(rng), num_players=num_players)
+        board = [Card(0, 0, None, 'base') for _ in range(5)]
+        deals = []
+        for _ in range(500):
+            deck.shuffle()
+            deals.append([type_from_code(code) for code in deck.deal_many(num_players * 2 + 5)])
+        deals = _cycle(deals)
+        cards = players.in_play + board
+
+        def operation():
+            # A new deal each call, so the winners cache never short-circuits
+            for card, card_type in zip(cards, next(deals)):
+                card.set_type(card_type)
+            players.find_winners(board)
+        return operation, 500
+    return setup
+
+
+def bench_deal(seed):
+    deck = Deck(seed=seed)
+
+    def operation():
+        deck.shuffle()
+        deck.deal_many(6)
+        deck.burn()
+        deck.deal_many(3)
+        deck.burn()
+        deck.deal()
+        deck.burn()
+        deck.deal()
+    return operation, 2000
+
+
+def _require_pygame():
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    try:
+        import pygame
+    except ImportError:
+        raise SkipBenchmark("pygame is not installed")
+    return pygame
+
+
+def bench_asset_startup(seed):
+    pygame = _require_pygame()
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from asset_manager import AssetManager
+    # Startup takes the atlas path when an up-to-date atlas exists, else loads every PNG
+    info = {'source': AssetManager().source}
+
+    def operation():
+        AssetManager()
+    return operation, 1, info
+
+
+def bench_render(full_redraw):
+    def setup(seed):
+        pygame = _require_pygame()
+        from game import Game
+        game = Game(seed=seed)
+        for _ in range(3):
+            game.input_handler.handle_key_right(game.board)
+        game.input_handler.toggle_hand_evaluations()
+        game.input_handler.toggle_winners()
+
+        def operation():
+            if full_redraw:
+                game.renderer.invalidate()
+            game.render()
+        return operation, 50
+    return setup
+
+
+def bench_green_to_transparent(seed):
+    try:
+        import cv2
+        import numpy as np
+        import transparent
+    except ImportError:
+        raise SkipBenchmark("cv2/numpy are not installed")
+
+    # Deterministic 500x700 reference card: noise with a green-screen border
+    rng = np.random.default_rng(seed)
+    image = rng.integers(0, 256, (700, 500, 3), dtype=np.uint8)
+    image[:60] = image[-60:] = (40, 200, 40)
+    image[:, :60] = image[:, -60:] = (40, 200, 40)
+    path = os.path.join(tempfile.mkdtemp(), 'reference.png')
+    cv2.imwrite(path, image)
+
+    def operation():
+        transparent.green_to_transparent(path, verbose=False)
+    return operation, 5
+
+
+BENCHMARKS = {
+    'evaluate_hand_5': bench_evaluate(5),
+    'evaluate_hand_6': bench_evaluate(6),
+    'evaluate_hand_7': bench_evaluate(7),
+    'compare_hands': bench_compare_hands,
+    'deal': bench_deal,
+    'asset_manager_startup': bench_asset_startup,
+    'render_frame_full': bench_render(True),
+    'render_frame_steady': bench_render(False),
+    'green_to_transparent': bench_green_to_transparent,
+}
+for _seats in range(2, 11):
+    BENCHMARKS[f'find_winners_{_seats}'] = bench_find_winners(_seats)
+
+
+def run_benchmarks(names, seed=DEFAULT_SEED, repeat=DEFAULT_REPEAT):
+    """
+    Run the named benchmarks; skipped ones report why
+    A setup returns (operation, number) plus an optional dict of notes stored with the results
+    """
+    results = {}
+    for name in names:
+        try:
+            operation, number, *info = BENCHMARKS[name](seed)
+        except SkipBenchmark as e:
+            results[name] = {'skipped': str(e)}
+            print(f"{name:28s} skipped: {e}")
+            continue
+        results[name] = measure(operation, number, repeat)
+        stats = results[name]
+        if info:
+            stats.update(info[0])  # Setup notes on what was measured, e.g. the asset source
+        print(f"{name:28s} {stats['ops_per_sec']:14,.1f} ops/s  "
+              f"p50 {stats['p50_us']:10.1f} us  p99 {stats['p99_us']:10.1f} us")
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Print ops/sec changes against a baseline; returns names that regressed beyond threshold"""
+    regressions = []
+    print(f"\n{'benchmark':28s} {'baseline':>14s} {'current':>14s} {'change':>9s}")
+    for name, stats in results.items():
+        before = baseline.get('results', {}).get(name)
+        if 'skipped' in stats or not before or 'skipped' in before:
+            continue
+        change = (stats['ops_per_sec'] / before['ops_per_sec'] - 1) * 100
+        flag = ''
+        if change < -threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:28s} {before['ops_per_sec']:14,.1f} {stats['ops_per_sec']:14,.1f} {change:+8.1f}%{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the benchmark suite')
+    parser.add_argument('-k', '--filter', default='', help='Only run benchmarks whose name contains this')
+    parser.add_argument('-s', '--seed', type=int, default=DEFAULT_SEED, help='Seed for every generated input')
+    parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT, help='Timed batches per benchmark')
+    parser.add_argument('-o', '--output', help='Write results as JSON to this file')
+    parser.add_argument('-b', '--baseline', help='Compare against a JSON file from an earlier run')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Percent ops/sec drop that fails the baseline comparison')
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    report = {
+        'meta': {
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': run_benchmarks(names, args.seed, args.repeat),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report['results'], baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed more than {args.threshold}%")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
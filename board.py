@@ -2,11 +2,15 @@
 """Game board and card management"""
 
 from card import Card
+from card_codes import type_from_code
 from constants import BOARD_POSITIONS_X, NUM_BOARD_CARDS, BOARD_Y_OFFSET
 
 class Board:
-    def __init__(self, asset_manager):
+    def __init__(self, asset_manager, deck=None):
         self.asset_manager = asset_manager
+        self.deck = deck
+        # Deck position before the first board card, so a reset can return them
+        self.deck_mark = deck.tell() if deck else 0
         self.cards = []
         self.create_cards()
     
@@ -27,18 +31,40 @@ class Board:
     def next_card(self, stage, card_type):
         if stage == 1:
             # First press: open cards 0, 1, 2 (first three cards)
-            for i in range(3):
-                self.set_card_type(i, card_type)
+            self._open_cards(range(3), card_type)
         elif stage == 2:
             # Second press: open card 3 (fourth card)
-            self.set_card_type(3, card_type)
+            self._open_cards([3], card_type)
         elif stage == 3:
             # Third press: open card 4 (fifth card)
-            self.set_card_type(4, card_type)
+            self._open_cards([4], card_type)
+
+    def _open_cards(self, indices, card_type):
+        """Reveal cards; random ones are burned and dealt from the deck when there is one"""
+        if card_type == 'random' and self.deck is not None:
+            self.deck.burn()
+            for i in indices:
+                self.set_card_type(i, type_from_code(self.deck.deal()))
+        else:
+            for i in indices:
+                self.set_card_type(i, card_type)
+
+    def mark_deck(self):
+        """Remember the deck position once hole cards are dealt"""
+        if self.deck is not None:
+            self.deck_mark = self.deck.tell()
 
     def reset_board(self):
         for card in self.cards:
-            card.card_type = 'base'
+            card.set_type('base')
+        if self.deck is not None:
+            # Put the board and burn cards back and reshuffle them
+            self.deck.rewind(self.deck_mark)
+            self.deck.shuffle_remaining()
+        
+    def get_codes(self):
+        """Get the integer codes of the revealed board cards"""
+        return [card.code for card in self.cards if card.code is not None]
         
     def draw(self, screen):
         """Draw all cards to the screen"""
@@ -0,0 +1,82 @@
+# canonical.py
+"""Suit-isomorphic canonical forms, so equivalent situations share cache entries"""
+
+from collections import OrderedDict
+from card_codes import CODE_RANK_BIT
+from constants import EQUITY_SAMPLES, EQUITY_EXACT_LIMIT, EQUITY_CACHE_SIZE
+from equity import calculate_equity, is_exact
+
+def canonical_form(hole_cards, board=()):
+    """
+    Relabel suits so every suit-isomorphic deal maps to the same cards
+    Each suit's signature is its rank mask in every hand and the board, in order;
+    suits are renumbered by signature, so card order within a hand never matters
+    Returns: (hole_cards, board, relabel) with sorted code tuples and relabel[old_suit] = new_suit
+    """
+    groups = [tuple(hole) for hole in hole_cards]
+    groups.append(tuple(board))
+    signatures = [[0] * len(groups) for _ in range(4)]
+    for g, codes in enumerate(groups):
+        for code in codes:
+            signatures[code & 3][g] |= CODE_RANK_BIT[code]
+
+    # Suits with equal signatures are interchangeable, so ties need no further ordering
+    order = sorted(range(4), key=signatures.__getitem__, reverse=True)
+    relabel = [0] * 4
+    for new_suit, old_suit in enumerate(order):
+        relabel[old_suit] = new_suit
+
+    canonical = tuple(tuple(sorted(code & ~3 | relabel[code & 3] for code in codes)) for codes in groups)
+    return canonical[:-1], canonical[-1], relabel
+
+def canonical_codes(codes):
+    """Canonical form of one set of cards (e.g. a 5-7 card hand)"""
+    return canonical_form((), codes)[1]
+
+class EquityCache:
+    """
+    LRU cache in front of equity.calculate_equity keyed by canonical form
+    Misses are computed on the canonical cards, so equal keys always mean equal results
+    """
+    def __init__(self, max_size=EQUITY_CACHE_SIZE, compute=calculate_equity):
+        self.max_size = max_size
+        self.compute = compute
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, hole_cards, board=(), samples=EQUITY_SAMPLES, seed=None, exact_limit=EQUITY_EXACT_LIMIT):
+        """Cache key plus the canonical cards it was built from"""
+        canonical_hole, canonical_board, _ = canonical_form(hole_cards, board)
+        if is_exact(hole_cards, board, exact_limit):
+            samples = seed = None  # Enumeration gives the same answer for any sampling settings
+        return (canonical_hole, canonical_board, samples, seed), canonical_hole, canonical_board
+
+    def get(self, key):
+        results = self.entries.get(key)
+        if results is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return [dict(result) for result in results]
+
+    def put(self, key, results):
+        self.entries[key] = results
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def calculate(self, hole_cards, board=(), samples=EQUITY_SAMPLES, seed=None, exact_limit=EQUITY_EXACT_LIMIT):
+        """Same arguments and results as calculate_equity (player order is kept)"""
+        key, canonical_hole, canonical_board = self.key(hole_cards, board, samples, seed, exact_limit)
+        results = self.get(key)
+        if results is None:
+            results = self.compute([list(hole) for hole in canonical_hole], list(canonical_board),
+                                   samples, seed, exact_limit)
+            self.put(key, results)
+            results = [dict(result) for result in results]
+        return results
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
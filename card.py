@@ -1,16 +1,26 @@
 # card.py
 """Card class and related functionality"""
 
-import pygame
 from constants import CARD_DIMENSIONS
+from card_codes import CODE_RANK, CODE_SUIT, SUIT_NAMES, code_from_type
 
 class Card:
+    __slots__ = ('x', 'y', 'asset_manager', 'card_type', 'code', 'rank', 'suit', '_rect')
+
     def __init__(self, x, y, asset_manager, card_type='base'):
         self.x = x
         self.y = y
         self.asset_manager = asset_manager
         self.set_type(card_type)
-        self.rect = pygame.Rect(x, y, CARD_DIMENSIONS[0], CARD_DIMENSIONS[1])
+        self._rect = None
+    
+    @property
+    def rect(self):
+        """Screen rectangle, built on first use so pure game logic never imports pygame"""
+        if self._rect is None:
+            import pygame
+            self._rect = pygame.Rect(self.x, self.y, CARD_DIMENSIONS[0], CARD_DIMENSIONS[1])
+        return self._rect
     
     def set_type(self, card_type):
         """Change the card type"""
@@ -18,6 +28,19 @@ class Card:
             self.card_type = self.asset_manager.get_random_asset_key()
         else:
             self.card_type = card_type
+        
+        # Decode once here so rank/suit lookups never re-parse the string
+        self.code = code_from_type(self.card_type)
+        if self.code is None:
+            self.rank = None
+            self.suit = None
+        else:
+            self.rank = CODE_RANK[self.code]
+            self.suit = CODE_SUIT[self.code]
+
+    def get_code(self):
+        """Get the integer card code (0-51), or None for base/joker"""
+        return self.code
 
     def get_type(self):
         return self.card_type
@@ -35,36 +58,19 @@ class Card:
         """Update card position"""
         self.x = x
         self.y = y
-        self.rect.x = x
-        self.rect.y = y
+        if self._rect is not None:
+            self._rect.x = x
+            self._rect.y = y
 
     def get_rank(self):
         """Get the rank of the card (2-14, where 11=J, 12=Q, 13=K, 14=A)"""
-        if self.card_type == 'base' or self.card_type == 'joker':
-            return None
-            
-        rank_char = self.card_type[0].lower()
-        if rank_char == 'a':
-            return 14
-        elif rank_char == 'k':
-            return 13
-        elif rank_char == 'q':
-            return 12
-        elif rank_char == 'j':
-            return 11
-        elif rank_char == 't':
-            return 10
-        else:
-            return int(rank_char)
+        return self.rank
     
     def get_suit(self):
         """Get the suit of the card (hearts, diamonds, clubs, spades)"""
-        if self.card_type == 'base' or self.card_type == 'joker':
+        if self.suit is None:
             return None
-            
-        suit_char = self.card_type[1].lower()
-        suit_map = {'h': 'hearts', 'd': 'diamonds', 'c': 'clubs', 's': 'spades'}
-        return suit_map.get(suit_char)
+        return SUIT_NAMES[self.suit]
     
     def get_rank_name(self):
         """Get human-readable rank name"""
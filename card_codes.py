@@ -0,0 +1,31 @@
+# card_codes.py
+"""Integer card encoding (0-51) shared by the evaluator and card logic"""
+
+# A card code is (rank - 2) * 4 + suit_index, so ranks 2-14 map to 0-12
+RANK_CHARS = '23456789tjqka'
+SUIT_CHARS = 'cdhs'
+SUIT_NAMES = ('clubs', 'diamonds', 'hearts', 'spades')
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+NUM_CARDS = 52
+
+# Per-code lookups so hot paths never do arithmetic or string parsing
+CODE_RANK = tuple((code >> 2) + 2 for code in range(NUM_CARDS))
+CODE_SUIT = tuple(code & 3 for code in range(NUM_CARDS))
+CODE_PRIME = tuple(RANK_PRIMES[code >> 2] for code in range(NUM_CARDS))
+CODE_RANK_BIT = tuple(1 << (code >> 2) for code in range(NUM_CARDS))
+
+
+def code_from_type(card_type):
+    """Parse a card type string such as 'as' or 'TD' into a card code, or None"""
+    if not isinstance(card_type, str) or len(card_type) != 2:
+        return None
+    rank_index = RANK_CHARS.find(card_type[0].lower())
+    suit_index = SUIT_CHARS.find(card_type[1].lower())
+    if rank_index < 0 or suit_index < 0:
+        return None
+    return rank_index * 4 + suit_index
+
+
+def type_from_code(code):
+    """Convert a card code back into its asset key, e.g. 48 -> 'ac'"""
+    return RANK_CHARS[code >> 2] + SUIT_CHARS[code & 3]
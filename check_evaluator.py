@@ -0,0 +1,92 @@
+# check_evaluator.py
+"""Regression check: the lookup evaluators against a brute-force best-of-five evaluator"""
+
+import argparse
+import random
+import sys
+from collections import Counter
+from itertools import combinations
+from card_codes import NUM_CARDS, type_from_code
+from lookup_evaluator import (HIGH_CARD, PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE,
+                              FOUR_OF_A_KIND, STRAIGHT_FLUSH, ROYAL_FLUSH, evaluate, pack_strength)
+
+DEFAULT_HANDS = 40000
+
+
+def five_card_strength(codes):
+    """Strength of exactly five cards, classified the way the original HandEvaluator did"""
+    ranks = sorted(((code >> 2) + 2 for code in codes), reverse=True)
+    is_flush = len({code & 3 for code in codes}) == 1
+    is_straight = len(set(ranks)) == 5 and ranks[0] - ranks[4] == 4
+    if ranks == [14, 5, 4, 3, 2]:
+        is_straight = True
+        ranks = [5, 4, 3, 2, 1]  # Ace low
+
+    counts = Counter(ranks)
+    shape = sorted(counts.values(), reverse=True)
+    grouped = sorted(counts, key=lambda rank: (counts[rank], rank), reverse=True)
+
+    if is_straight and is_flush:
+        return pack_strength(ROYAL_FLUSH if ranks[0] == 14 else STRAIGHT_FLUSH, [ranks[0]])
+    if shape == [4, 1]:
+        return pack_strength(FOUR_OF_A_KIND, grouped)
+    if shape == [3, 2]:
+        return pack_strength(FULL_HOUSE, grouped)
+    if is_flush:
+        return pack_strength(FLUSH, ranks)
+    if is_straight:
+        return pack_strength(STRAIGHT, [ranks[0]])
+    if shape == [3, 1, 1]:
+        return pack_strength(THREE_OF_A_KIND, grouped)
+    if shape == [2, 2, 1]:
+        return pack_strength(TWO_PAIR, grouped)
+    if shape == [2, 1, 1, 1]:
+        return pack_strength(PAIR, grouped)
+    return pack_strength(HIGH_CARD, ranks)
+
+
+def brute_force(codes):
+    """Best five-card strength among 5-7 codes by trying every subset"""
+    return max(five_card_strength(five) for five in combinations(codes, 5))
+
+
+def check(num_hands=DEFAULT_HANDS, seed=0):
+    """
+    Compare evaluate() (and batch_evaluator when numpy is installed) with brute_force()
+    on random 5, 6 and 7 card hands
+    Returns: list of (codes, expected, got) mismatches
+    """
+    rng = random.Random(seed)
+    hands = [rng.sample(range(NUM_CARDS), 5 + i % 3) for i in range(num_hands)]
+    expected = [brute_force(codes) for codes in hands]
+    mismatches = [(codes, want, evaluate(codes)) for codes, want in zip(hands, expected) if evaluate(codes) != want]
+
+    try:
+        import numpy as np
+        from batch_evaluator import evaluate_codes
+    except ImportError:
+        return mismatches
+    for size in (5, 6, 7):
+        rows = [i for i, codes in enumerate(hands) if len(codes) == size]
+        strengths = evaluate_codes(np.array([hands[i] for i in rows], dtype=np.int64)).tolist()
+        mismatches.extend((hands[i], expected[i], got) for i, got in zip(rows, strengths) if got != expected[i])
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the lookup evaluators against brute force')
+    parser.add_argument('-n', '--hands', type=int, default=DEFAULT_HANDS, help='Random hands to compare')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Seed for the random hands')
+    args = parser.parse_args(argv)
+
+    mismatches = check(args.hands, args.seed)
+    for codes, want, got in mismatches[:10]:
+        print(f"{' '.join(type_from_code(code) for code in codes)}: expected {want:#x}, got {got:#x}")
+    if mismatches:
+        print(f"{len(mismatches)} mismatch(es) in {args.hands} hands")
+        return 1
+    print(f"{args.hands} hands match")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
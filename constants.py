@@ -7,11 +7,24 @@ SCREEN_HEIGHT = 600
 FPS = 60
 BG_COLOR = (30, 30, 30)
 
+# Frame pacing settings
+IDLE_FPS = 5              # Render rate once the table has been quiet for a while
+LOGIC_HZ = 60             # Fixed rate of game logic ticks, independent of rendering
+ACTIVE_WINDOW_MS = 1000   # Stay at full FPS this long after the last input
+SLEEP_AFTER_MS = 5000     # Block on the event queue after this long without input
+# Logic ticks run at most per frame; older time (sleep, stalls) is dropped.
+# Two idle frames' worth, so throttled frames still run every tick they owe
+MAX_CATCHUP_TICKS = 2 * -(-LOGIC_HZ // IDLE_FPS)
+
 # Player settings
 PLAYER_HEIGHT = 40
 PLAYER_SPEED = 5
 NUM_PLAYERS = 3
 PLAYER_NAMES = ["Player 1", "Player 2", "Player 3"]
+MAX_SEATS = 10
+
+# Table settings
+NUM_TABLES = 1  # Independent tables run by one Game; TAB cycles the one on screen
 
 # Card settings
 CARD_DIMENSIONS = (100, 140)
@@ -29,8 +42,40 @@ BOARD_Y_OFFSET = 200  # Distance from top for board cards
 PLAYER_Y_OFFSET = 80  # Distance from bottom for player cards
 NAME_Y_OFFSET = 70    # Distance from bottom for player name
 
+# Equity settings
+EQUITY_SAMPLES = 10000       # Monte Carlo runouts when exact enumeration is too big
+EQUITY_EXACT_LIMIT = 5000    # Enumerate every runout when there are at most this many
+EQUITY_CACHE_SIZE = 4096     # Canonical (suit-isomorphic) situations kept by canonical.EquityCache
+
+# Preflop tables (built with `python preflop.py`)
+PREFLOP_PATH = "preflop.bin"
+PREFLOP_SAMPLES = 20000          # Runouts per hand class and opponent count
+PREFLOP_HEADS_UP_SAMPLES = 2000  # Runouts per class-vs-class matchup
+
+# Server settings
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+
+# Hand history settings
+HAND_HISTORY_PATH = "hand_history.bin"  # Binary log; its index is written next to it as .idx
+HISTORY_CHUNK = 1_000_000  # Hands per chunk when scanning a log (64 MB of records)
+
+# UI settings
+TEXT_CACHE_SIZE = 128  # Rendered text surfaces kept by UI.render_text
+
+# Profiler settings (P toggles the overlay in game)
+PROFILE_HISTORY = 300               # Frames kept for the rolling histograms
+PROFILE_BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66)  # Histogram bucket upper bounds
+PROFILE_DUMP_PATH = "profile.json"  # Periodic JSON dump written while profiling
+PROFILE_DUMP_INTERVAL_MS = 5000
+
 # Input settings
-INPUT_DELAY_IN_TICKS = 10
+INPUT_DEBOUNCE_MS = 150  # Ignore repeat presses of the same key within this window
+
+# Texture atlas (built with `python atlas.py`, loaded instead of the PNGs below)
+ATLAS_IMAGE = "assets/atlas.png"
+ATLAS_INDEX = "assets/atlas.json"
+ATLAS_COLUMNS = 9
 
 # Asset paths
 ASSETS = {
@@ -88,4 +133,12 @@ ASSETS = {
     "jh": "assets/jh.png",
     "qh": "assets/qh.png",
     "kh": "assets/kh.png"
-}
\ No newline at end of file
+}
+
+# Deck themes (name -> asset mapping); extra themes add their own mapping here
+DEFAULT_THEME = 'default'
+ASSET_THEMES = {
+    DEFAULT_THEME: ASSETS,
+}
+LAZY_ASSETS = False    # Load card faces on first draw instead of at startup
+ASSET_CACHE_SIZE = 64  # Card faces kept in memory by the lazy AssetManager
\ No newline at end of file
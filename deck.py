@@ -0,0 +1,79 @@
+# deck.py
+"""Shuffled 52-card deck dealt without replacement"""
+
+import random
+from array import array
+from card_codes import NUM_CARDS
+
+class Deck:
+    """
+    Card codes in one preallocated array; dealing only moves a position
+    rng: any object with randrange(n) (random.Random, SystemRandom, ...)
+    """
+    def __init__(self, rng=None, seed=None):
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.cards = array('b', range(NUM_CARDS))
+        self.position = 0
+
+    def shuffle(self):
+        """Return every card to the deck and shuffle in place (Fisher-Yates)"""
+        self.position = 0
+        self._shuffle_from(0)
+
+    def shuffle_remaining(self):
+        """Shuffle only the undealt cards, keeping dealt ones out"""
+        self._shuffle_from(self.position)
+
+    def _shuffle_from(self, start):
+        cards = self.cards
+        randrange = self.rng.randrange
+        for i in range(NUM_CARDS - 1, start, -1):
+            j = start + randrange(i - start + 1)
+            cards[i], cards[j] = cards[j], cards[i]
+
+    def stack(self, codes):
+        """Put `codes` on top in this order and shuffle every other card under them"""
+        top = set(codes)
+        if len(top) != len(codes):
+            raise ValueError("Cannot stack the same card twice")
+        self.cards = array('b', list(codes) + [code for code in range(NUM_CARDS) if code not in top])
+        self.position = 0
+        self._shuffle_from(len(codes))
+
+    def deal(self):
+        """Deal the top card code"""
+        if self.position >= NUM_CARDS:
+            raise IndexError("Cannot deal from an empty deck")
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+    def deal_many(self, count):
+        """Deal `count` card codes"""
+        if self.position + count > NUM_CARDS:
+            raise IndexError(f"Cannot deal {count} cards, only {self.remaining()} left")
+        start = self.position
+        self.position += count
+        return self.cards[start:self.position].tolist()
+
+    def burn(self):
+        """Discard the top card"""
+        self.deal()
+
+    def reset(self):
+        """Return every card without reshuffling or allocating"""
+        self.position = 0
+
+    def remaining(self):
+        """Number of undealt cards"""
+        return NUM_CARDS - self.position
+
+    def tell(self):
+        """Current deal position, for a later rewind"""
+        return self.position
+
+    def rewind(self, position):
+        """Return every card dealt since `position` to the deck"""
+        if not 0 <= position <= self.position:
+            raise ValueError(f"Cannot rewind to {position} from {self.position}")
+        self.position = position
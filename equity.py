@@ -0,0 +1,160 @@
+# equity.py
+"""Win/tie/loss equity for every player at any poker stage"""
+
+import random
+from itertools import combinations
+from math import comb
+from card_codes import CODE_PRIME, CODE_RANK_BIT, NUM_CARDS
+from constants import EQUITY_SAMPLES, EQUITY_EXACT_LIMIT, NUM_BOARD_CARDS
+from lookup_evaluator import RANK_STRENGTH, FLUSH_STRENGTH
+
+
+def remaining_deck(hole_cards, board):
+    """Get the card codes not held by any player or on the board"""
+    dead = set(board)
+    for hole in hole_cards:
+        dead.update(hole)
+    return [code for code in range(NUM_CARDS) if code not in dead]
+
+
+def exact_runouts(deck, needed):
+    """Every possible completion of the board"""
+    return combinations(deck, needed)
+
+
+def sampled_runouts(deck, needed, samples, rng):
+    """Random board completions drawn without replacement from the deck"""
+    deck = list(deck)
+    size = len(deck)
+    for _ in range(samples):
+        # Partial Fisher-Yates: only the first `needed` slots are shuffled
+        for i in range(needed):
+            j = i + rng.randrange(size - i)
+            deck[i], deck[j] = deck[j], deck[i]
+        yield deck[:needed]
+
+
+def count_outcomes(hole_cards, board, runouts):
+    """
+    Play out each runout and tally the showdown for every player
+    Returns: (wins, ties, losses, shares, total) where shares splits ties
+    """
+    num_players = len(hole_cards)
+    wins = [0] * num_players
+    ties = [0] * num_players
+    losses = [0] * num_players
+    shares = [0.0] * num_players
+    total = 0
+
+    # Fold each player's known cards into a prime product and suit masks once
+    base_products = []
+    base_masks = []
+    for hole in hole_cards:
+        product = 1
+        masks = [0, 0, 0, 0]
+        for code in list(hole) + list(board):
+            product *= CODE_PRIME[code]
+            masks[code & 3] |= CODE_RANK_BIT[code]
+        base_products.append(product)
+        base_masks.append(masks)
+
+    rank_strength = RANK_STRENGTH
+    flush_strength = FLUSH_STRENGTH
+    players = range(num_players)
+    strengths = [0] * num_players
+
+    for runout in runouts:
+        run_product = 1
+        run_masks = [0, 0, 0, 0]
+        for code in runout:
+            run_product *= CODE_PRIME[code]
+            run_masks[code & 3] |= CODE_RANK_BIT[code]
+
+        best = 0
+        for p in players:
+            masks = base_masks[p]
+            strength = rank_strength[base_products[p] * run_product]
+            for suit in (0, 1, 2, 3):
+                flush = flush_strength[masks[suit] | run_masks[suit]]
+                if flush > strength:
+                    strength = flush
+            strengths[p] = strength
+            if strength > best:
+                best = strength
+
+        winners = [p for p in players if strengths[p] == best]
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+            shares[winners[0]] += 1.0
+        else:
+            split = 1.0 / len(winners)
+            for p in winners:
+                ties[p] += 1
+                shares[p] += split
+        total += 1
+
+    for p in players:
+        losses[p] = total - wins[p] - ties[p]
+
+    return wins, ties, losses, shares, total
+
+
+def summarize(counts):
+    """Turn raw outcome counts into per-player probability dicts"""
+    wins, ties, losses, shares, total = counts
+    results = []
+    for i in range(len(wins)):
+        results.append({
+            'player_index': i,
+            'win': wins[i] / total if total else 0.0,
+            'tie': ties[i] / total if total else 0.0,
+            'lose': losses[i] / total if total else 0.0,
+            'equity': shares[i] / total if total else 0.0,
+        })
+    return results
+
+
+def is_exact(hole_cards, board, exact_limit=EQUITY_EXACT_LIMIT):
+    """Whether enumerating every runout is within the exact limit"""
+    needed = NUM_BOARD_CARDS - len(board)
+    deck_size = NUM_CARDS - len(board) - sum(len(hole) for hole in hole_cards)
+    return comb(deck_size, needed) <= exact_limit
+
+
+def calculate_equity(hole_cards, board=(), samples=EQUITY_SAMPLES, seed=None, exact_limit=EQUITY_EXACT_LIMIT):
+    """
+    Calculate each player's win/tie/lose probability and pot equity
+    hole_cards: one list of card codes per player; board: revealed codes
+    Enumerates all runouts when cheap (turn/river), otherwise samples
+    `samples` runouts with a Random seeded from `seed`
+    """
+    deck = remaining_deck(hole_cards, board)
+    needed = NUM_BOARD_CARDS - len(board)
+    if is_exact(hole_cards, board, exact_limit):
+        runouts = exact_runouts(deck, needed)
+    else:
+        runouts = sampled_runouts(deck, needed, samples, random.Random(seed))
+    return summarize(count_outcomes(hole_cards, board, runouts))
+
+
+def calculate_equity_batch(tables, samples=EQUITY_SAMPLES, seed=None, exact_limit=EQUITY_EXACT_LIMIT):
+    """
+    Calculate equity for many tables in one call
+    tables: iterable of (hole_cards, board) pairs; table i samples with seed + i
+    A serial loop over calculate_equity: tables share no work, since each one's
+    deck and base products depend on its own cards; SimulationPool.equity_batch
+    runs the same loop with the tables spread over worker processes
+    """
+    results = []
+    for i, (hole_cards, board) in enumerate(tables):
+        table_seed = None if seed is None else seed + i
+        results.append(calculate_equity(hole_cards, board, samples, table_seed, exact_limit))
+    return results
+
+
+def table_equity(players, board, samples=EQUITY_SAMPLES, seed=None, cache=None):
+    """Calculate equity for a Players/Board pair at its current stage (through a canonical.EquityCache when given)"""
+    hole_cards = [players.get_player_codes(i) for i in range(players.num_players)]
+    if cache is not None:
+        return cache.calculate(hole_cards, board.get_codes(), samples, seed)
+    return calculate_equity(hole_cards, board.get_codes(), samples, seed)
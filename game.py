@@ -3,81 +3,154 @@
 
 import pygame
 import sys
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BG_COLOR
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, LAZY_ASSETS, NUM_TABLES, NUM_PLAYERS
 from asset_manager import AssetManager
-from board import Board
-from players import Players
+from table import TableManager
 from input_handler import InputHandler
 from ui import UI
+from renderer import DirtyRenderer
+from scheduler import FrameScheduler
+from profiler import FrameProfiler
 
 class Game:
-    def __init__(self):
+    def __init__(self, num_tables=NUM_TABLES, seats=NUM_PLAYERS, profile=False, recorder=None, seed=None):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Simple Game MVP - Refactored")
-        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler()
+        self.profiler = FrameProfiler(enabled=profile)
         
         # Initialize game components
-        self.asset_manager = AssetManager()
-        self.board = Board(self.asset_manager)
-        self.players = Players(self.asset_manager)
-        self.input_handler = InputHandler()
+        # Every table shares the asset manager, evaluator and UI font caches
+        self.asset_manager = AssetManager(lazy=LAZY_ASSETS)
+        self.recorder = recorder  # Optional HandRecorder; every table logs its hands to it
+        self.tables = TableManager(num_tables, seats, asset_manager=self.asset_manager, seed=seed, recorder=recorder)
+        self.input_handlers = [InputHandler(on_stage=table.stage_changed) for table in self.tables]
+        self.active_table = 0
         self.ui = UI()
+        self.renderer = DirtyRenderer(self.screen, BG_COLOR)
         
         # Game state
         self.ticks = 0
         self.running = True
     
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
+    @property
+    def board(self):
+        """Board of the table on screen"""
+        return self.tables[self.active_table].board
+    
+    @property
+    def players(self):
+        """Players of the table on screen"""
+        return self.tables[self.active_table].players
+    
+    @property
+    def input_handler(self):
+        """Input state (stage and toggles) of the table on screen"""
+        return self.input_handlers[self.active_table]
+    
+    def next_table(self):
+        """Show the next table"""
+        self.active_table = (self.active_table + 1) % len(self.tables)
+    
+    def show_record(self, record):
+        """Show a recorded hand (a hand_replay row) on the active table; play continues from it"""
+        from hand_replay import record_cards
+        hole_cards, board_codes, stage = record_cards(record)
+        if len(hole_cards) != self.players.num_players:
+            raise ValueError(f"Hand was played with {len(hole_cards)} seats, table has {self.players.num_players}")
+        self.tables[self.active_table].show_hand(hole_cards, board_codes, stage)
+        self.input_handler.poker_stage = stage
+        self.renderer.invalidate()
+    
+    def handle_events(self, block=False):
+        """Handle pygame events; with block=True sleep until one arrives. Returns True if any were handled"""
+        events = pygame.event.get()
+        if not events and block:
+            events = [pygame.event.wait()]
+            self.profiler.begin_frame()  # Time spent asleep is not frame time
+        
+        with self.profiler.section('handle_events'):
+            self._dispatch_events(events)
+        return bool(events)
+    
+    def _dispatch_events(self, events):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_TAB:
+                    self.next_table()
+                elif event.key == pygame.K_p:
+                    self.profiler.toggle()
+                    self.renderer.invalidate()
+                else:
+                    self.input_handler.handle_event(event, self.board)
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.renderer.invalidate()
     
     def update(self):
         """Update game state"""
-        self.input_handler.handle_input(self.board)
-        self.input_handler.update()
         self.ticks += 1
     
     def render(self):
-        """Render the game"""
-        self.screen.fill(BG_COLOR)
+        """Render the game, repainting only regions that changed"""
+        profiler = self.profiler
+        canvas = self.renderer.begin_frame()
         
         # Draw game objects
-        self.board.draw(self.screen)
-        self.players.draw(self.screen)
+        with profiler.section('render/board'):
+            self.board.draw(canvas)
+        with profiler.section('render/players'):
+            self.players.draw(canvas)
         
         # Draw UI
-        self.ui.draw_debug_info(self.screen, self.ticks, self.input_handler.get_timeout(), self.input_handler.get_poker_stage())
-        self.ui.draw_instructions(self.screen)
-        self.ui.draw_player_names(self.screen, self.players.get_names())
+        with profiler.section('render/ui_text'):
+            profile_lines = profiler.overlay_lines() if profiler.enabled else None
+            self.ui.draw_debug_info(canvas, self.ticks, self.input_handler.get_timeout(), self.input_handler.get_poker_stage(), profile_lines)
+            self.ui.draw_instructions(canvas)
+            self.ui.draw_player_names(canvas, self.players.get_names(), self.players.positions)
+            self.ui.draw_table_info(canvas, self.active_table, len(self.tables))
         
         # Draw hand evaluations if enabled
         if self.input_handler.get_show_hand_evaluations():
-            self.ui.draw_hand_evaluations(self.screen, self.players, self.board, True)
+            with profiler.section('render/evaluations'):
+                self.ui.draw_hand_evaluations(canvas, self.players, self.board, True)
         
         # Draw winners if enabled and stage is complete
         if self.input_handler.get_show_winners() and self.input_handler.get_poker_stage() >= 3:
-            winners = self.players.find_winners(self.board.cards)
-            self.ui.draw_winners(self.screen, winners)
+            with profiler.section('render/winners'):
+                winners = self.players.find_winners(self.board.cards)
+                self.ui.draw_winners(canvas, winners)
         
-        pygame.display.flip()
+        with profiler.section('render/present'):
+            self.renderer.end_frame()
     
     def run(self):
         """Main game loop"""
+        profiler = self.profiler
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            profiler.begin_frame()
+            if self.handle_events(block=self.scheduler.should_block()):
+                self.scheduler.mark_active()
+            
+            # Logic runs at a fixed rate; rendering follows the scheduler's pace
+            with profiler.section('update'):
+                for _ in range(self.scheduler.logic_steps()):
+                    self.update()
+            with profiler.section('render'):
+                self.render()
+            profiler.end_frame()
+            self.scheduler.wait()
         
         self.quit()
     
     def quit(self):
         """Clean up and exit"""
+        if self.recorder is not None:
+            self.tables.finish_records()
+            self.recorder.close()
         pygame.quit()
         sys.exit()
\ No newline at end of file
@@ -3,6 +3,7 @@
 
 from collections import Counter
 from enum import Enum
+import lookup_evaluator
 
 class HandRank(Enum):
     """Poker hand rankings (higher value = better hand)"""
@@ -17,108 +18,128 @@ class HandRank(Enum):
     STRAIGHT_FLUSH = 9
     ROYAL_FLUSH = 10
 
+# Cards contributed by each packed rank, for hands built from rank groups
+_RANK_MULTIPLICITIES = {
+    HandRank.PAIR: (2, 1, 1, 1),
+    HandRank.TWO_PAIR: (2, 2, 1),
+    HandRank.THREE_OF_A_KIND: (3, 1, 1),
+    HandRank.FULL_HOUSE: (3, 2),
+    HandRank.FOUR_OF_A_KIND: (4, 1),
+}
+
 class HandEvaluator:
+    # Calls across all instances; the profiler reads the per-frame difference
+    evaluate_calls = 0
+    
     def __init__(self):
         pass
     
     def evaluate_hand(self, player_cards, community_cards):
         """
-        Evaluate the best 5-card hand from 7 available cards
+        Evaluate the best 5-card hand from up to 7 available cards
         Returns: (HandRank, hand_value, best_cards, description)
         """
-        # Filter out base/joker cards and get only real cards
-        all_cards = []
-        for card in player_cards + community_cards:
-            if card.get_rank() is not None and card.get_suit() is not None:
-                all_cards.append(card)
-        
-        if len(all_cards) < 5:
+        HandEvaluator.evaluate_calls += 1
+        cards, codes = self._collect_codes(player_cards + community_cards)
+        if len(codes) < 5:
             return None  # Not enough cards to evaluate
         
-        # Generate all possible 5-card combinations
-        from itertools import combinations
-        best_hand = None
-        best_rank = HandRank.HIGH_CARD
-        best_value = 0
-        best_cards = []
-        
-        for five_cards in combinations(all_cards, 5):
-            rank, value, description = self._evaluate_five_cards(list(five_cards))
-            if self._is_better_hand(rank, value, best_rank, best_value):
-                best_hand = description
-                best_rank = rank
-                best_value = value
-                best_cards = list(five_cards)
-        
-        return best_rank, best_value, best_cards, best_hand
+        strength = lookup_evaluator.evaluate(codes)
+        return self.describe_strength(strength, cards, codes)
     
-    def _evaluate_five_cards(self, cards):
-        """Evaluate exactly 5 cards and return rank, value, and description"""
-        ranks = sorted([card.get_rank() for card in cards], reverse=True)
-        suits = [card.get_suit() for card in cards]
-        
-        # Check for flush
-        is_flush = len(set(suits)) == 1
-        
-        # Check for straight
-        is_straight = self._is_straight(ranks)
-        
-        # Special case: A-2-3-4-5 straight (wheel)
-        if ranks == [14, 5, 4, 3, 2]:
-            is_straight = True
-            ranks = [5, 4, 3, 2, 1]  # Ace low
-        
-        # Count rank frequencies
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        unique_ranks = sorted(rank_counts.keys(), key=lambda x: (rank_counts[x], x), reverse=True)
-        
-        # Determine hand type
-        if is_straight and is_flush:
-            if ranks[0] == 14 and ranks[1] == 13:  # Royal flush
-                return HandRank.ROYAL_FLUSH, ranks[0], "Royal Flush"
-            else:
-                return HandRank.STRAIGHT_FLUSH, ranks[0], f"Straight Flush, {self._rank_name(ranks[0])} high"
-        
-        elif counts == [4, 1]:  # Four of a kind
-            quad_rank = unique_ranks[0]
-            kicker = unique_ranks[1]
-            return HandRank.FOUR_OF_A_KIND, (quad_rank, kicker), f"Four {self._rank_name(quad_rank)}s"
-        
-        elif counts == [3, 2]:  # Full house
-            trips_rank = unique_ranks[0]
-            pair_rank = unique_ranks[1]
-            return HandRank.FULL_HOUSE, (trips_rank, pair_rank), f"Full House, {self._rank_name(trips_rank)}s over {self._rank_name(pair_rank)}s"
-        
-        elif is_flush:
-            return HandRank.FLUSH, tuple(ranks), f"Flush, {self._rank_name(ranks[0])} high"
-        
-        elif is_straight:
-            return HandRank.STRAIGHT, ranks[0], f"Straight, {self._rank_name(ranks[0])} high"
-        
-        elif counts == [3, 1, 1]:  # Three of a kind
-            trips_rank = unique_ranks[0]
-            kickers = sorted([r for r in ranks if r != trips_rank], reverse=True)
-            return HandRank.THREE_OF_A_KIND, (trips_rank, tuple(kickers)), f"Three {self._rank_name(trips_rank)}s"
-        
-        elif counts == [2, 2, 1]:  # Two pair
-            pairs = sorted([r for r, c in rank_counts.items() if c == 2], reverse=True)
-            kicker = [r for r, c in rank_counts.items() if c == 1][0]
-            return HandRank.TWO_PAIR, (tuple(pairs), kicker), f"Two Pair, {self._rank_name(pairs[0])}s and {self._rank_name(pairs[1])}s"
+    def hand_strength(self, player_cards, community_cards):
+        """
+        Evaluate the best 5-card hand as a single comparable integer
+        Returns: strength (higher is better) or None with fewer than 5 cards
+        """
+        _, codes = self._collect_codes(player_cards + community_cards)
+        return self.evaluate_codes(codes)
+    
+    def evaluate_codes(self, codes):
+        """
+        Evaluate integer card codes (0-51) directly, skipping Card objects
+        Returns: strength (higher is better) or None with fewer than 5 cards
+        """
+        if len(codes) < 5:
+            return None
+        return lookup_evaluator.evaluate(codes)
+    
+    def evaluate_batch(self, hole_cards, board):
+        """
+        Evaluate many hands at once with NumPy (requires numpy)
+        hole_cards: (N, 2) card codes; board: (N, 5) card codes
+        Returns: ((N,) strengths, (N,) HandRank values)
+        """
+        from batch_evaluator import evaluate_batch
+        return evaluate_batch(hole_cards, board)
+    
+    def describe_strength(self, strength, cards, codes):
+        """Expand a strength into the (HandRank, value, best_cards, description) tuple"""
+        rank = HandRank(lookup_evaluator.strength_category(strength))
+        ranks = lookup_evaluator.strength_ranks(strength)
+        value, description = self._value_and_description(rank, ranks)
+        best_cards = self._select_best_cards(rank, ranks, cards, codes)
+        return rank, value, best_cards, description
+    
+    def _collect_codes(self, cards):
+        """Get the real cards (no base/joker) and their card codes"""
+        real_cards = []
+        codes = []
+        for card in cards:
+            code = card.code
+            if code is not None:
+                real_cards.append(card)
+                codes.append(code)
+        return real_cards, codes
+    
+    def _value_and_description(self, rank, ranks):
+        """Rebuild the hand value and description from packed ranks"""
+        r1, r2, r3, r4, r5 = ranks
+        
+        if rank == HandRank.ROYAL_FLUSH:
+            return r1, "Royal Flush"
+        elif rank == HandRank.STRAIGHT_FLUSH:
+            return r1, f"Straight Flush, {self._rank_name(r1)} high"
+        elif rank == HandRank.FOUR_OF_A_KIND:
+            return (r1, r2), f"Four {self._rank_name(r1)}s"
+        elif rank == HandRank.FULL_HOUSE:
+            return (r1, r2), f"Full House, {self._rank_name(r1)}s over {self._rank_name(r2)}s"
+        elif rank == HandRank.FLUSH:
+            return tuple(ranks), f"Flush, {self._rank_name(r1)} high"
+        elif rank == HandRank.STRAIGHT:
+            return r1, f"Straight, {self._rank_name(r1)} high"
+        elif rank == HandRank.THREE_OF_A_KIND:
+            return (r1, (r2, r3)), f"Three {self._rank_name(r1)}s"
+        elif rank == HandRank.TWO_PAIR:
+            return ((r1, r2), r3), f"Two Pair, {self._rank_name(r1)}s and {self._rank_name(r2)}s"
+        elif rank == HandRank.PAIR:
+            return (r1, (r2, r3, r4)), f"Pair of {self._rank_name(r1)}s"
+        else:
+            return tuple(ranks), f"High Card, {self._rank_name(r1)}"
+    
+    def _select_best_cards(self, rank, ranks, cards, codes):
+        """Pick the five cards that make up the hand, in their original order"""
+        suit = None
+        if rank in (HandRank.STRAIGHT, HandRank.STRAIGHT_FLUSH, HandRank.ROYAL_FLUSH):
+            high = ranks[0]
+            wanted = {r: 1 for r in range(high, high - 5, -1)}
+            if high == 5:
+                wanted[14] = wanted.pop(1)  # Wheel uses the ace low
+        else:
+            multiplicities = _RANK_MULTIPLICITIES.get(rank, (1, 1, 1, 1, 1))
+            wanted = dict(zip(ranks, multiplicities))
         
-        elif counts == [2, 1, 1, 1]:  # One pair
-            pair_rank = [r for r, c in rank_counts.items() if c == 2][0]
-            kickers = sorted([r for r in ranks if r != pair_rank], reverse=True)
-            return HandRank.PAIR, (pair_rank, tuple(kickers)), f"Pair of {self._rank_name(pair_rank)}s"
+        if rank in (HandRank.FLUSH, HandRank.STRAIGHT_FLUSH, HandRank.ROYAL_FLUSH):
+            suit_counts = Counter(code & 3 for code in codes)
+            suit = suit_counts.most_common(1)[0][0]
         
-        else:  # High card
-            return HandRank.HIGH_CARD, tuple(ranks), f"High Card, {self._rank_name(ranks[0])}"
-    
-    def _is_straight(self, ranks):
-        """Check if ranks form a straight"""
-        if len(set(ranks)) != 5:
-            return False
-        return ranks[0] - ranks[4] == 4
+        best_cards = []
+        for card, code in zip(cards, codes):
+            card_rank = (code >> 2) + 2
+            if wanted.get(card_rank, 0) > 0 and (suit is None or code & 3 == suit):
+                wanted[card_rank] -= 1
+                best_cards.append(card)
+        return best_cards
     
     def _rank_name(self, rank):
         """Convert rank number to name"""
@@ -137,51 +158,20 @@ class HandEvaluator:
         if hand2_result is None:
             return 1
         
-        rank1, value1, _, _ = hand1_result
-        rank2, value2, _, _ = hand2_result
-        
-        if rank1.value > rank2.value:
-            return 1
-        elif rank1.value < rank2.value:
-            return -1
-        else:
-            # Same rank, compare values using our helper method
-            return self._compare_values(value1, value2)
-    
-    def _is_better_hand(self, rank1, value1, rank2, value2):
-        """Compare two hands to see if the first is better"""
-        # First compare hand ranks
-        if rank1.value > rank2.value:
-            return True
-        elif rank1.value < rank2.value:
-            return False
-        
-        # Same rank, compare values (need to handle different value types)
-        return self._compare_values(value1, value2) > 0
+        strength1 = self.result_strength(hand1_result)
+        strength2 = self.result_strength(hand2_result)
+        return (strength1 > strength2) - (strength1 < strength2)
     
-    def _compare_values(self, value1, value2):
-        """
-        Compare hand values, handling different types (int, tuple)
-        Returns: 1 if value1 > value2, -1 if value1 < value2, 0 if equal
-        """
-        # Convert single values to tuples for consistent comparison
-        if not isinstance(value1, tuple):
-            value1 = (value1,)
-        if not isinstance(value2, tuple):
-            value2 = (value2,)
-        
-        # Compare element by element
-        for v1, v2 in zip(value1, value2):
-            if isinstance(v1, tuple) and isinstance(v2, tuple):
-                # Recursively compare nested tuples
-                result = self._compare_values(v1, v2)
-                if result != 0:
-                    return result
-            else:
-                if v1 > v2:
-                    return 1
-                elif v1 < v2:
-                    return -1
-        
-        # If we get here, they're equal
-        return 0
+    def result_strength(self, hand_result):
+        """Convert a (HandRank, value, ...) result back into its integer strength"""
+        rank, value = hand_result[0], hand_result[1]
+        
+        if rank in (HandRank.ROYAL_FLUSH, HandRank.STRAIGHT_FLUSH, HandRank.STRAIGHT):
+            ranks = (value,)
+        elif rank in (HandRank.FOUR_OF_A_KIND, HandRank.FULL_HOUSE, HandRank.FLUSH, HandRank.HIGH_CARD):
+            ranks = value
+        elif rank == HandRank.TWO_PAIR:
+            ranks = value[0] + (value[1],)
+        else:  # Three of a kind / pair: (rank, kickers)
+            ranks = (value[0],) + value[1]
+        return lookup_evaluator.pack_strength(rank.value, ranks)
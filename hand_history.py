@@ -0,0 +1,193 @@
+# hand_history.py
+"""Append-only binary hand history: fixed 64-byte records plus a hand_id index"""
+
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from constants import HAND_HISTORY_PATH, MAX_SEATS, NUM_BOARD_CARDS, NUM_PLAYER_CARDS
+
+# File header, padded to one record so records stay 64-byte aligned for mmap
+MAGIC = b'PKRHIST\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHH52x')
+
+# hand_id, timestamp, table_id, num_seats, final_stage, hole cards (2 per seat),
+# board cards, ms from deal to flop/turn/river, winners bitmask, winning strength, pad
+RECORD = struct.Struct('<QdHBB20s5s3IHIx')
+RECORD_SIZE = RECORD.size
+assert HEADER.size == RECORD_SIZE == 64
+
+EMPTY_CARD = 0xFF           # Card slot with no card (unused seat or unopened board card)
+STAGE_NOT_REACHED = 0xFFFFFFFF
+INDEX_SUFFIX = '.idx'       # Sidecar file: one uint64 hand_id per record, in file order
+
+def _card_bytes(codes, size):
+    """Pack card codes (None = empty) into a fixed-width byte string"""
+    slots = bytearray([EMPTY_CARD]) * size
+    for i, code in enumerate(codes[:size]):
+        if code is not None:
+            slots[i] = code
+    return bytes(slots)
+
+def _card_codes(data):
+    return [None if byte == EMPTY_CARD else byte for byte in data]
+
+def unpack_record(data):
+    """Decode one 64-byte record into a dict"""
+    (hand_id, timestamp, table_id, num_seats, final_stage, hole, board,
+     flop_ms, turn_ms, river_ms, winners, win_strength) = RECORD.unpack(data)
+    hole = _card_codes(hole)
+    return {
+        'hand_id': hand_id,
+        'timestamp': timestamp,
+        'table_id': table_id,
+        'num_seats': num_seats,
+        'final_stage': final_stage,
+        'hole_cards': [hole[i * NUM_PLAYER_CARDS:(i + 1) * NUM_PLAYER_CARDS] for i in range(num_seats)],
+        'board': _card_codes(board),
+        'stage_ms': [None if ms == STAGE_NOT_REACHED else ms for ms in (flop_ms, turn_ms, river_ms)],
+        'winners': [i for i in range(num_seats) if winners >> i & 1],
+        'win_strength': win_strength,
+    }
+
+def read_header(f):
+    """Check the file header; raises ValueError for anything that is not a hand history"""
+    data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError("Hand history header is truncated")
+    magic, version, record_size = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+        raise ValueError(f"Not a version {VERSION} hand history file")
+
+def count_records(path):
+    """Number of complete records in a hand history file"""
+    return max(0, os.path.getsize(path) - HEADER.size) // RECORD_SIZE
+
+def load_index(path):
+    """hand_ids in record order as array('Q'); sorted, since ids only grow"""
+    index = array('Q')
+    index_path = path + INDEX_SUFFIX
+    if os.path.exists(index_path):
+        with open(index_path, 'rb') as f:
+            index.frombytes(f.read())
+    return index
+
+def rebuild_index(path):
+    """Rewrite the sidecar index from the records themselves"""
+    index = array('Q')
+    with open(path, 'rb') as f:
+        read_header(f)
+        while True:
+            data = f.read(RECORD_SIZE)
+            if len(data) < RECORD_SIZE:
+                break
+            index.append(struct.unpack_from('<Q', data)[0])
+    with open(path + INDEX_SUFFIX, 'wb') as f:
+        index.tofile(f)
+    return index
+
+def read_hand(path, hand_id, index=None):
+    """
+    Random access to one hand by id through the index
+    Returns: record dict, or None if the id is not in the file
+    """
+    index = load_index(path) if index is None else index
+    position = bisect_left(index, hand_id)
+    if position == len(index) or index[position] != hand_id:
+        return None
+    with open(path, 'rb') as f:
+        f.seek(HEADER.size + position * RECORD_SIZE)
+        return unpack_record(f.read(RECORD_SIZE))
+
+class HandRecorder:
+    """
+    Writes one record per finished hand
+    Tables call begin() when cards are dealt, stage() as the board opens and finish() at the end
+    """
+    def __init__(self, path=HAND_HISTORY_PATH):
+        self.path = path
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if is_new:
+            next_id = 0
+        else:
+            with open(path, 'rb') as f:
+                read_header(f)
+            if (os.path.getsize(path) - HEADER.size) % RECORD_SIZE:
+                raise ValueError(f"{path} ends in a partial record")
+            index = load_index(path)
+            if len(index) != count_records(path):
+                index = rebuild_index(path)  # Interrupted between the log and index writes
+            next_id = index[-1] + 1 if index else 0
+
+        self.file = open(path, 'ab')
+        if is_new:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+        self.index = open(path + INDEX_SUFFIX, 'wb' if is_new else 'ab')
+        self.next_id = next_id
+        self.pending = {}  # table_id -> hand in progress
+
+    def begin(self, table_id, hole_cards):
+        """Start a hand; hole_cards holds one list of codes per seat"""
+        if len(hole_cards) > MAX_SEATS:
+            raise ValueError(f"At most {MAX_SEATS} seats can be recorded")
+        codes = []
+        for seat in hole_cards:
+            codes.extend((list(seat) + [None] * NUM_PLAYER_CARDS)[:NUM_PLAYER_CARDS])
+        self.pending[table_id] = {
+            'timestamp': time.time(),
+            'start': time.perf_counter(),
+            'num_seats': len(hole_cards),
+            'hole': _card_bytes(codes, MAX_SEATS * NUM_PLAYER_CARDS),
+            'stage_ms': [STAGE_NOT_REACHED] * 3,
+            'stage': 0,
+        }
+
+    def stage(self, table_id, stage):
+        """Note the time a street (1: flop, 2: turn, 3: river) was opened"""
+        hand = self.pending.get(table_id)
+        if hand is None or not 1 <= stage <= 3:
+            return
+        hand['stage_ms'][stage - 1] = int((time.perf_counter() - hand['start']) * 1000)
+        hand['stage'] = max(hand['stage'], stage)
+
+    def finish(self, table_id, board_codes, winners=(), win_strength=None):
+        """
+        Write the hand as a record
+        board_codes: one code (or None) per board position; winners: seat indices
+        Hands abandoned before the flop (a redeal, reset or quit) are written with final_stage 0
+        Returns: the hand_id, or None if the table had no hand in progress
+        """
+        hand = self.pending.pop(table_id, None)
+        if hand is None:
+            return None
+        winner_mask = 0
+        for i in winners:
+            winner_mask |= 1 << i
+
+        hand_id = self.next_id
+        self.next_id += 1
+        self.file.write(RECORD.pack(
+            hand_id, hand['timestamp'], table_id, hand['num_seats'], hand['stage'],
+            hand['hole'], _card_bytes(list(board_codes), NUM_BOARD_CARDS),
+            *hand['stage_ms'], winner_mask, win_strength or 0))
+        self.index.write(struct.pack('<Q', hand_id))
+        self.flush()  # A crash loses at most the hand in progress
+        return hand_id
+
+    def flush(self):
+        self.file.flush()
+        self.index.flush()
+
+    def close(self):
+        """Flush and close; hands still in progress are dropped"""
+        self.file.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
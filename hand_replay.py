@@ -0,0 +1,213 @@
+# hand_replay.py
+"""Memory-mapped replay and analytics over hand history logs"""
+
+import argparse
+import os
+import numpy as np
+from batch_evaluator import evaluate_batch
+from card_codes import type_from_code
+from constants import HAND_HISTORY_PATH, HISTORY_CHUNK, MAX_SEATS, NUM_PLAYER_CARDS
+from deck import Deck
+from hand_evaluator import HandRank
+from hand_history import HEADER, RECORD_SIZE, EMPTY_CARD, STAGE_NOT_REACHED, INDEX_SUFFIX, read_header, count_records
+from lookup_evaluator import CATEGORY_SHIFT
+
+# Same layout as hand_history.RECORD, so the file maps straight onto an array
+RECORD_DTYPE = np.dtype([
+    ('hand_id', '<u8'),
+    ('timestamp', '<f8'),
+    ('table_id', '<u2'),
+    ('num_seats', 'u1'),
+    ('final_stage', 'u1'),
+    ('hole', 'u1', (MAX_SEATS * NUM_PLAYER_CARDS,)),
+    ('board', 'u1', (5,)),
+    ('stage_ms', '<u4', (3,)),
+    ('winners', '<u2'),
+    ('win_strength', '<u4'),
+    ('pad', 'u1'),
+])
+assert RECORD_DTYPE.itemsize == RECORD_SIZE
+
+def open_log(path=HAND_HISTORY_PATH):
+    """
+    Map a hand history read-only; nothing is read until a slice is used
+    Returns: structured array (np.memmap) with one row per hand
+    """
+    with open(path, 'rb') as f:
+        read_header(f)
+    count = count_records(path)
+    if count == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+
+def open_index(path=HAND_HISTORY_PATH):
+    """Map the sidecar index of hand_ids (contiguous, so searches touch only a few pages)"""
+    index_path = path + INDEX_SUFFIX
+    if not os.path.exists(index_path) or os.path.getsize(index_path) == 0:
+        return None
+    return np.memmap(index_path, dtype='<u8', mode='r')
+
+def iter_chunks(records, chunk_size=HISTORY_CHUNK):
+    """Yield consecutive views of at most chunk_size hands (no copies)"""
+    for start in range(0, len(records), chunk_size):
+        yield records[start:start + chunk_size]
+
+def analyze(records, chunk_size=HISTORY_CHUNK, table_id=None):
+    """
+    Aggregate stats over a mapped log, one chunk in memory at a time
+    Returns: dict with hand and showdown counts, per-seat wins/ties/win rate,
+             HandRank frequencies, winning HandRanks, split-pot sizes and final stages
+    """
+    seat_hands = np.zeros(MAX_SEATS, dtype=np.int64)
+    seat_wins = np.zeros(MAX_SEATS, dtype=np.int64)
+    seat_ties = np.zeros(MAX_SEATS, dtype=np.int64)
+    hand_ranks = np.zeros(len(HandRank) + 1, dtype=np.int64)
+    winning_ranks = np.zeros(len(HandRank) + 1, dtype=np.int64)
+    split_sizes = np.zeros(MAX_SEATS + 1, dtype=np.int64)
+    final_stages = np.zeros(4, dtype=np.int64)
+    hands = showdowns = mismatches = 0
+
+    for chunk in iter_chunks(records, chunk_size):
+        if table_id is not None:
+            chunk = chunk[chunk['table_id'] == table_id]
+        hands += len(chunk)
+        final_stages += np.bincount(chunk['final_stage'], minlength=4)[:4]
+
+        # Only hands that reached the river have a full board and a result
+        chunk = chunk[chunk['final_stage'] == 3]
+        showdowns += len(chunk)
+        if not len(chunk):
+            continue
+        num_seats = chunk['num_seats']
+        winners = chunk['winners'].astype(np.int32)
+        num_winners = np.zeros(len(chunk), dtype=np.int64)
+        for seat in range(MAX_SEATS):
+            num_winners += winners >> seat & 1
+        split_sizes += np.bincount(num_winners, minlength=MAX_SEATS + 1)[:MAX_SEATS + 1]
+        winning_ranks += np.bincount(chunk['win_strength'] >> CATEGORY_SHIFT, minlength=len(winning_ranks))
+
+        # Re-evaluate every seat: HandRank frequencies, and a check on the recorded winner
+        board = chunk['board']
+        best = np.zeros(len(chunk), dtype=np.int64)
+        for seat in range(int(num_seats.max())):
+            seated = num_seats > seat
+            won = (winners >> seat & 1).astype(bool)
+            seat_hands[seat] += seated.sum()
+            seat_wins[seat] += (won & (num_winners == 1)).sum()
+            seat_ties[seat] += (won & (num_winners > 1)).sum()
+
+            hole = chunk['hole'][seated, seat * NUM_PLAYER_CARDS:(seat + 1) * NUM_PLAYER_CARDS]
+            strengths, categories = evaluate_batch(hole, board[seated])
+            hand_ranks += np.bincount(categories, minlength=len(hand_ranks))
+            best[seated] = np.maximum(best[seated], strengths)
+        has_winner = num_winners > 0
+        mismatches += int((best[has_winner] != chunk['win_strength'][has_winner]).sum())
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        win_rate = np.where(seat_hands > 0, seat_wins / seat_hands, 0.0)
+    return {
+        'hands': hands,
+        'showdowns': showdowns,
+        'seat_hands': seat_hands.tolist(),
+        'seat_wins': seat_wins.tolist(),
+        'seat_ties': seat_ties.tolist(),
+        'win_rate': win_rate.tolist(),
+        'hand_ranks': {rank.name: int(hand_ranks[rank.value]) for rank in HandRank},
+        'winning_ranks': {rank.name: int(winning_ranks[rank.value]) for rank in HandRank},
+        'split_sizes': {n: int(split_sizes[n]) for n in range(1, MAX_SEATS + 1) if split_sizes[n]},
+        'final_stages': final_stages.tolist(),
+        'strength_mismatches': mismatches,
+    }
+
+def find_record(records, hand_id, index=None):
+    """
+    Row of one hand, found by binary search over hand_ids
+    Pass the mapped index for large logs: the strided hand_id column would be copied first
+    """
+    hand_ids = records['hand_id'] if index is None or len(index) != len(records) else index
+    position = int(np.searchsorted(hand_ids, hand_id))
+    if position == len(records) or records[position]['hand_id'] != hand_id:
+        return None
+    return records[position]
+
+def record_cards(record):
+    """
+    Cards of a record row as codes (None = empty slot)
+    Returns: (hole_cards, board_codes, final_stage) with one hole list per seat
+    """
+    num_seats = int(record['num_seats'])
+    hole = [None if code == EMPTY_CARD else code for code in record['hole'][:num_seats * NUM_PLAYER_CARDS].tolist()]
+    hole_cards = [hole[i:i + NUM_PLAYER_CARDS] for i in range(0, len(hole), NUM_PLAYER_CARDS)]
+    board_codes = [None if code == EMPTY_CARD else code for code in record['board'].tolist()]
+    return hole_cards, board_codes, int(record['final_stage'])
+
+def replay_hand(record, board, players):
+    """
+    Put a recorded hand onto a Board and Players pair for review
+    Returns: the hand's final stage, for the InputHandler/Table poker_stage
+    """
+    hole_cards, board_codes, final_stage = record_cards(record)
+    if players.num_players != len(hole_cards):
+        raise ValueError(f"Hand was played with {len(hole_cards)} seats, table has {players.num_players}")
+    for i, code in enumerate(code for hole in hole_cards for code in hole):
+        players.set_card_type(i, 'base' if code is None else type_from_code(code))
+    for i, code in enumerate(board_codes):
+        board.set_card_type(i, 'base' if code is None else type_from_code(code))
+    return final_stage
+
+def load_replay(records, hand_id, asset_manager=None, index=None):
+    """
+    Build a Board and Players showing one recorded hand
+    Returns: (board, players, final_stage), or None if the hand is not in the log
+    """
+    from board import Board
+    from players import Players
+
+    record = find_record(records, hand_id, index)
+    if record is None:
+        return None
+    # The deck only fills the initial cards, which the replay overwrites
+    players = Players(asset_manager, deck=Deck(), num_players=int(record['num_seats']))
+    board = Board(asset_manager)
+    return board, players, replay_hand(record, board, players)
+
+def format_hand(record):
+    """One-line text description of a recorded hand"""
+    def cards(codes):
+        return ' '.join('--' if code == EMPTY_CARD else type_from_code(code) for code in codes)
+    seats = [cards(record['hole'][i * NUM_PLAYER_CARDS:(i + 1) * NUM_PLAYER_CARDS].tolist())
+             for i in range(int(record['num_seats']))]
+    stage_ms = ['-' if ms == STAGE_NOT_REACHED else f"{ms}ms" for ms in record['stage_ms'].tolist()]
+    winners = [i + 1 for i in range(MAX_SEATS) if int(record['winners']) >> i & 1]
+    return (f"Hand {int(record['hand_id'])} (table {int(record['table_id'])}): "
+            f"{' | '.join(seats)} | board {cards(record['board'].tolist())} | "
+            f"streets {'/'.join(stage_ms)} | winners {winners or '-'}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Scan or replay a hand history log')
+    parser.add_argument('path', nargs='?', default=HAND_HISTORY_PATH, help='Hand history file')
+    parser.add_argument('--hand', type=int, default=None, help='Print one hand instead of the stats')
+    parser.add_argument('--table', type=int, default=None, help='Only count hands from this table')
+    parser.add_argument('--chunk', type=int, default=HISTORY_CHUNK, help='Hands per chunk')
+    args = parser.parse_args(argv)
+
+    records = open_log(args.path)
+    if args.hand is not None:
+        record = find_record(records, args.hand, open_index(args.path))
+        print(format_hand(record) if record is not None else f"Hand {args.hand} is not in {args.path}")
+        return
+
+    stats = analyze(records, args.chunk, args.table)
+    print(f"{stats['hands']:,} hands, {stats['showdowns']:,} showdowns")
+    for seat, hands in enumerate(stats['seat_hands']):
+        if hands:
+            print(f"Seat {seat + 1}: {stats['seat_wins'][seat]:,} wins, {stats['seat_ties'][seat]:,} ties "
+                  f"({stats['win_rate'][seat]:.1%} of {hands:,})")
+    for name, count in stats['hand_ranks'].items():
+        print(f"{name:16s} {count:12,}  winning {stats['winning_ranks'][name]:,}")
+    print(f"Split pots: {stats['split_sizes']}")
+    if stats['strength_mismatches']:
+        print(f"WARNING: {stats['strength_mismatches']:,} hands record a winning strength that does not re-evaluate")
+
+if __name__ == "__main__":
+    main()
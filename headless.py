@@ -0,0 +1,65 @@
+# headless.py
+"""Headless simulation: run hands through the game logic without pygame"""
+
+import argparse
+import time
+from constants import NUM_PLAYERS
+from hand_history import HandRecorder
+from lookup_evaluator import strength_category
+from table import TableManager
+
+class HeadlessEngine:
+    def __init__(self, seed=None, num_tables=1, seats=NUM_PLAYERS, recorder=None):
+        self.tables = TableManager(num_tables, seats, seed=seed, recorder=recorder)
+
+    def run(self, num_hands):
+        """
+        Play `num_hands` complete hands on every table as fast as possible
+        Returns: dict with per-table, per-seat wins/ties, winning HandRank counts and timing
+        """
+        wins = [[0] * table.players.num_players for table in self.tables]
+        ties = [[0] * table.players.num_players for table in self.tables]
+        categories = {category: 0 for category in range(1, 11)}
+
+        start = time.perf_counter()
+        for _ in range(num_hands):
+            for t, (strengths, winners) in enumerate(self.tables.play_hands()):
+                if len(winners) == 1:
+                    wins[t][winners[0]] += 1
+                else:
+                    for i in winners:
+                        ties[t][i] += 1
+                categories[strength_category(strengths[winners[0]])] += 1
+        elapsed = time.perf_counter() - start
+        total_hands = num_hands * len(self.tables)
+
+        return {
+            'hands': total_hands,
+            'wins': wins,
+            'ties': ties,
+            'categories': categories,
+            'elapsed': elapsed,
+            'hands_per_second': total_hands / elapsed if elapsed else 0.0,
+        }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run poker hands without a display')
+    parser.add_argument('-n', '--hands', type=int, default=10000, help='Number of hands to play per table')
+    parser.add_argument('-s', '--seed', type=int, default=None, help='Deck seed for reproducible runs')
+    parser.add_argument('-t', '--tables', type=int, default=1, help='Number of tables to run side by side')
+    parser.add_argument('--seats', type=int, default=NUM_PLAYERS, help='Players per table')
+    parser.add_argument('--record', metavar='PATH', default=None, help='Append every hand to this hand history file')
+    args = parser.parse_args(argv)
+
+    recorder = HandRecorder(args.record) if args.record else None
+    stats = HeadlessEngine(args.seed, args.tables, args.seats, recorder).run(args.hands)
+    print(f"Played {stats['hands']:,} hands in {stats['elapsed']:.2f}s ({stats['hands_per_second']:,.0f} hands/s)")
+    for t in range(args.tables):
+        for i in range(args.seats):
+            print(f"Table {t + 1} Player {i + 1}: {stats['wins'][t][i]:,} wins, {stats['ties'][t][i]:,} ties")
+    if recorder is not None:
+        recorder.close()
+        print(f"Recorded hands up to id {recorder.next_id - 1} in {args.record}")
+
+if __name__ == "__main__":
+    main()
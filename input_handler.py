@@ -2,61 +2,73 @@
 """Input handling and management"""
 
 import pygame
-from constants import INPUT_DELAY_IN_TICKS, NUM_BOARD_CARDS
+from constants import INPUT_DEBOUNCE_MS, NUM_BOARD_CARDS
 
 RANDOM = 'random'
 class InputHandler:
-    def __init__(self):
-        self.input_timeout = 0
+    def __init__(self, on_stage=None):
+        self.on_stage = on_stage  # Called with each new stage, e.g. Table.stage_changed
+        self.last_press_ms = {}  # key -> time of the last accepted press
+        self.last_input_ms = None
         self.poker_stage = 0  # 0: not started, 1: first 3 cards, 2: fourth card, 3: fifth card
         self.show_hand_evaluations = False
         self.show_winners = False
     
-    def update(self):
-        """Update input timeout"""
-        if self.input_timeout != 0:
-            self.input_timeout += 1
-            if self.input_timeout >= INPUT_DELAY_IN_TICKS:
-                self.input_timeout = 0
-    
-    def handle_input(self, board):
-        """Handle keyboard input - poker style card opening"""
-        keys = pygame.key.get_pressed()
-        if self.input_timeout == 0:
-            if keys[pygame.K_RIGHT]:
-                self.handle_key_right(board)
-            elif keys[pygame.K_LEFT]:
-                self.handle_key_left(board)
-            elif keys[pygame.K_h]:
-                self.toggle_hand_evaluations()
-            elif keys[pygame.K_w]:
-                self.toggle_winners()
+    def handle_event(self, event, board, now_ms=None):
+        """Handle a KEYDOWN event - poker style card opening; returns True if it was used"""
+        if event.type != pygame.KEYDOWN:
+            return False
+        
+        # Debounce per key by time, so responsiveness does not depend on frame rate
+        now = pygame.time.get_ticks() if now_ms is None else now_ms
+        last = self.last_press_ms.get(event.key)
+        if last is not None and now - last < INPUT_DEBOUNCE_MS:
+            return False
+        
+        if event.key == pygame.K_RIGHT:
+            self.handle_key_right(board)
+        elif event.key == pygame.K_LEFT:
+            self.handle_key_left(board)
+        elif event.key == pygame.K_h:
+            self.toggle_hand_evaluations()
+        elif event.key == pygame.K_w:
+            self.toggle_winners()
+        else:
+            return False
+        
+        self.last_press_ms[event.key] = now
+        self.last_input_ms = now
+        return True
     
     def handle_key_right(self, board):
         if self.poker_stage < 3:
             self.poker_stage += 1
             board.next_card(self.poker_stage, RANDOM)
-            self.input_timeout = 1
+            if self.on_stage is not None:
+                self.on_stage(self.poker_stage)
 
     def handle_key_left(self, board):
         if self.poker_stage > 0:
+            # Report first, so the finished hand is seen with its board still open
+            if self.on_stage is not None:
+                self.on_stage(0)
             board.reset_board()
             self.poker_stage = 0
-            self.input_timeout = 1
 
     def toggle_hand_evaluations(self):
         """Toggle display of hand evaluations"""
         self.show_hand_evaluations = not self.show_hand_evaluations
-        self.input_timeout = 1
     
     def toggle_winners(self):
         """Toggle display of winners"""
         self.show_winners = not self.show_winners
-        self.input_timeout = 1
     
-    def get_timeout(self):
-        """Get current input timeout"""
-        return self.input_timeout
+    def get_timeout(self, now_ms=None):
+        """Get milliseconds left before the last pressed key is accepted again"""
+        if self.last_input_ms is None:
+            return 0
+        now = pygame.time.get_ticks() if now_ms is None else now_ms
+        return max(0, INPUT_DEBOUNCE_MS - (now - self.last_input_ms))
     
     def get_poker_stage(self):
         """Get current poker stage"""
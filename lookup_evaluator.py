@@ -0,0 +1,191 @@
+# lookup_evaluator.py
+"""Lookup-table hand strength for 5, 6 or 7 card codes"""
+
+import marshal
+import os
+from itertools import combinations_with_replacement
+from card_codes import CODE_PRIME, CODE_RANK_BIT, RANK_PRIMES
+
+# Hand categories (same numbering as HandRank)
+HIGH_CARD = 1
+PAIR = 2
+TWO_PAIR = 3
+THREE_OF_A_KIND = 4
+STRAIGHT = 5
+FLUSH = 6
+FULL_HOUSE = 7
+FOUR_OF_A_KIND = 8
+STRAIGHT_FLUSH = 9
+ROYAL_FLUSH = 10
+
+# A strength is category << 20 followed by up to five 4-bit ranks (2-14),
+# most significant first, so plain integer comparison orders hands
+CATEGORY_SHIFT = 20
+RANK_SHIFTS = (16, 12, 8, 4, 0)
+NUM_RANK_MASKS = 1 << 13
+
+# Built tables are cached next to this module; bump the version whenever a builder changes
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lookup_tables.bin')
+TABLES_VERSION = 1
+
+
+def pack_strength(category, ranks):
+    """Pack a category and its significant ranks into one integer"""
+    strength = category << CATEGORY_SHIFT
+    for rank, shift in zip(ranks, RANK_SHIFTS):
+        strength |= rank << shift
+    return strength
+
+
+def strength_category(strength):
+    """Get the hand category (1-10) of a strength"""
+    return strength >> CATEGORY_SHIFT
+
+
+def strength_ranks(strength):
+    """Get the five packed ranks of a strength (unused slots are 0)"""
+    return [(strength >> shift) & 0xF for shift in RANK_SHIFTS]
+
+
+def _top_ranks(mask, count):
+    """Highest `count` ranks (2-14) present in a 13-bit rank mask"""
+    ranks = []
+    for index in range(12, -1, -1):
+        if mask & (1 << index):
+            ranks.append(index + 2)
+            if len(ranks) == count:
+                break
+    return ranks
+
+
+def _build_straight_table():
+    """High card of the best straight in every rank mask (0 if none)"""
+    windows = [(high, 0b11111 << (high - 6)) for high in range(14, 5, -1)]
+    windows.append((5, 0b1000000001111))  # Wheel: A-2-3-4-5
+    table = [0] * NUM_RANK_MASKS
+    for mask in range(NUM_RANK_MASKS):
+        for high, window in windows:
+            if mask & window == window:
+                table[mask] = high
+                break
+    return table
+
+
+def _build_flush_table():
+    """Best flush or straight flush strength for every suited rank mask"""
+    table = [0] * NUM_RANK_MASKS
+    for mask in range(NUM_RANK_MASKS):
+        if bin(mask).count('1') < 5:
+            continue
+        high = STRAIGHT_HIGH[mask]
+        if high == 14:
+            table[mask] = pack_strength(ROYAL_FLUSH, [14])
+        elif high:
+            table[mask] = pack_strength(STRAIGHT_FLUSH, [high])
+        else:
+            table[mask] = pack_strength(FLUSH, _top_ranks(mask, 5))
+    return table
+
+
+def _rank_count_strength(counts):
+    """Best non-flush strength for per-rank counts (index 0 = deuce)"""
+    present = [i for i in range(12, -1, -1) if counts[i]]
+    quads = [i for i in present if counts[i] >= 4]
+    trips = [i for i in present if counts[i] == 3]
+    pairs = [i for i in present if counts[i] == 2]
+
+    if quads:
+        kicker = next(i for i in present if i != quads[0])
+        return pack_strength(FOUR_OF_A_KIND, [quads[0] + 2, kicker + 2])
+
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return pack_strength(FULL_HOUSE, [trips[0] + 2, pair + 2])
+
+    mask = 0
+    for i in present:
+        mask |= 1 << i
+    high = STRAIGHT_HIGH[mask]
+    if high:
+        return pack_strength(STRAIGHT, [high])
+
+    if trips:
+        kickers = [i for i in present if i != trips[0]][:2]
+        return pack_strength(THREE_OF_A_KIND, [r + 2 for r in [trips[0]] + kickers])
+
+    if len(pairs) >= 2:
+        kicker = next(i for i in present if i not in pairs[:2])
+        return pack_strength(TWO_PAIR, [r + 2 for r in pairs[:2] + [kicker]])
+
+    if pairs:
+        kickers = [i for i in present if i != pairs[0]][:3]
+        return pack_strength(PAIR, [r + 2 for r in [pairs[0]] + kickers])
+
+    return pack_strength(HIGH_CARD, [i + 2 for i in present[:5]])
+
+
+def _build_rank_table():
+    """Non-flush strength keyed by the prime product of 5, 6 and 7 ranks"""
+    table = {}
+    for size in (5, 6, 7):
+        for combo in combinations_with_replacement(range(13), size):
+            counts = [0] * 13
+            product = 1
+            for i in combo:
+                counts[i] += 1
+                product *= RANK_PRIMES[i]
+            if max(counts) > 4:
+                continue
+            table[product] = _rank_count_strength(counts)
+    return table
+
+
+def _load_tables(path=TABLES_PATH):
+    """
+    (FLUSH_STRENGTH, RANK_STRENGTH) from the cache file
+    Building them takes most of a second, so a missing or stale cache is rebuilt and saved once
+    """
+    try:
+        with open(path, 'rb') as f:
+            version, tables = marshal.loads(f.read())
+        if version == TABLES_VERSION:
+            return tables
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    tables = (_build_flush_table(), _build_rank_table())
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            marshal.dump((TABLES_VERSION, tables), f)
+        os.replace(temp_path, path)  # Atomic, so processes importing at once never read half a file
+    except OSError:
+        pass  # Read-only install: every import builds the tables instead
+    return tables
+
+
+STRAIGHT_HIGH = _build_straight_table()
+FLUSH_STRENGTH, RANK_STRENGTH = _load_tables()
+
+
+def evaluate(codes):
+    """Strength of the best five-card hand among 5-7 card codes"""
+    product = 1
+    masks = [0, 0, 0, 0]
+    for code in codes:
+        product *= CODE_PRIME[code]
+        masks[code & 3] |= CODE_RANK_BIT[code]
+
+    strength = RANK_STRENGTH.get(product)
+    if strength is None:
+        # Only reachable with duplicated cards (more than four of a rank)
+        counts = [0] * 13
+        for code in codes:
+            counts[code >> 2] += 1
+        strength = _rank_count_strength(counts)
+
+    for mask in masks:
+        flush = FLUSH_STRENGTH[mask]
+        if flush > strength:
+            strength = flush
+    return strength
@@ -1,8 +1,42 @@
 # main.py
 """Entry point for the game"""
 
-from game import Game
+import sys
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    if '--headless' in sys.argv:
+        # Logic-only run: no pygame import, assets or frame clock
+        from headless import main
+        main([arg for arg in sys.argv[1:] if arg != '--headless'])
+    elif '--serve' in sys.argv:
+        # Socket front end over the same table logic
+        from server import main
+        main([arg for arg in sys.argv[1:] if arg != '--serve'])
+    else:
+        from constants import NUM_PLAYERS
+        from game import Game
+        # --profile starts with the profiler overlay on (P toggles it in game)
+        # --record appends every hand to the binary hand history
+        recorder = None
+        if '--record' in sys.argv:
+            from hand_history import HandRecorder
+            recorder = HandRecorder()
+        # --replay HAND_ID shows a recorded hand from the hand history instead of a new deal
+        record = None
+        if '--replay' in sys.argv:
+            from hand_replay import open_log, open_index, find_record
+            position = sys.argv.index('--replay') + 1
+            if position >= len(sys.argv) or not sys.argv[position].isdigit():
+                sys.exit("Usage: main.py --replay HAND_ID (a non-negative integer)")
+            hand_id = int(sys.argv[position])
+            try:
+                record = find_record(open_log(), hand_id, open_index())
+            except (OSError, ValueError) as e:
+                sys.exit(f"Cannot read the hand history: {e}")
+            if record is None:
+                sys.exit(f"Hand {hand_id} is not in the hand history")
+        seats = int(record['num_seats']) if record is not None else NUM_PLAYERS
+        game = Game(seats=seats, profile='--profile' in sys.argv, recorder=recorder)
+        if record is not None:
+            game.show_record(record)
+        game.run()
\ No newline at end of file
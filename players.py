@@ -2,26 +2,67 @@
 """Player class with hand management"""
 
 from card import Card
-from constants import PLAYER_POSITIONS_X, SCREEN_HEIGHT, CARD_DIMENSIONS, NUM_PLAYER_CARDS, PLAYER_Y_OFFSET, NUM_PLAYERS, PLAYER_NAMES
+from card_codes import type_from_code
+from constants import PLAYER_POSITIONS_X, SCREEN_WIDTH, SCREEN_HEIGHT, CARD_DIMENSIONS, NUM_PLAYER_CARDS, PLAYER_Y_OFFSET, NUM_PLAYERS, PLAYER_NAMES, MAX_SEATS
 from hand_evaluator import HandEvaluator
+from showdown import best_players, rank_players, build_side_pots, award_pots
+
+def seat_positions(num_players):
+    """Card x positions for each seat: the fixed layout for the default table, otherwise spread evenly"""
+    if num_players == NUM_PLAYERS:
+        return PLAYER_POSITIONS_X
+    
+    slot = SCREEN_WIDTH // num_players
+    card_width = CARD_DIMENSIONS[0]
+    # Overlap the two hole cards (and neighbours) when seats are too narrow
+    spacing = min(PLAYER_POSITIONS_X[0][1] - PLAYER_POSITIONS_X[0][0], max(slot - card_width, 20))
+    pair_width = card_width + spacing
+    positions = []
+    for i in range(num_players):
+        left = i * slot + (slot - pair_width) // 2
+        left = min(max(left, 0), SCREEN_WIDTH - pair_width)
+        positions.append((left, left + spacing))
+    return tuple(positions)
 
 class Players:
-    def __init__(self, asset_manager, names=PLAYER_NAMES):
+    def __init__(self, asset_manager, names=None, deck=None, num_players=NUM_PLAYERS, hand_evaluator=None):
+        if not 2 <= num_players <= MAX_SEATS:
+            raise ValueError(f"A table needs 2-{MAX_SEATS} players, got {num_players}")
         self.asset_manager = asset_manager
+        self.deck = deck
+        self.num_players = num_players
+        self.positions = seat_positions(num_players)
+        if names is None:
+            names = PLAYER_NAMES if num_players == NUM_PLAYERS else [f"Player {i + 1}" for i in range(num_players)]
         self.names = names
         self.in_play = []
-        self.hand_evaluator = HandEvaluator()
+        # Shared across tables when given; the lookup tables are global either way
+        self.hand_evaluator = hand_evaluator or HandEvaluator()
+        # Last evaluation/showdown, reused until a card code changes
+        self._evaluation_cache = (None, None)
+        self._winners_cache = (None, None)
         self.create_hands()
     
     def create_hands(self):
         y_position = SCREEN_HEIGHT - PLAYER_Y_OFFSET - CARD_DIMENSIONS[1]
         
-        for i in range(NUM_PLAYERS):
+        for i in range(self.num_players):
             for j in range(NUM_PLAYER_CARDS):
-                x_position = PLAYER_POSITIONS_X[i][j]
-                card = Card(x_position, y_position, self.asset_manager, 'random')
+                x_position = self.positions[i][j]
+                card = Card(x_position, y_position, self.asset_manager, self._random_type())
                 self.in_play.append(card)
     
+    def _random_type(self):
+        """Deal from the deck when there is one, otherwise pick any card"""
+        if self.deck is not None:
+            return type_from_code(self.deck.deal())
+        return 'random'
+    
+    def deal_new_hand(self):
+        """Give every player fresh hole cards"""
+        for card in self.in_play:
+            card.set_type(self._random_type())
+    
     def draw(self, screen):
         for card in self.in_play:
             card.draw(screen)
@@ -41,52 +82,86 @@ class Players:
     
     def get_player_cards(self, player_index):
         """Get the cards for a specific player"""
-        if player_index < 0 or player_index >= NUM_PLAYERS:
+        if player_index < 0 or player_index >= self.num_players:
             return []
         
         start_index = player_index * NUM_PLAYER_CARDS
         end_index = start_index + NUM_PLAYER_CARDS
         return self.in_play[start_index:end_index]
     
+    def get_player_codes(self, player_index):
+        """Get the integer card codes for a specific player"""
+        return [card.code for card in self.get_player_cards(player_index) if card.code is not None]
+    
     def evaluate_player_hand(self, player_index, community_cards):
         """Evaluate a player's best hand using their cards + community cards"""
         player_cards = self.get_player_cards(player_index)
         return self.hand_evaluator.evaluate_hand(player_cards, community_cards)
     
+    def _cache_key(self, community_cards):
+        """Key the current hole and board cards by their codes"""
+        hole_codes = tuple(card.code for card in self.in_play)
+        board_codes = tuple(card.code for card in community_cards if card.code is not None)
+        return hole_codes, board_codes
+    
     def evaluate_all_hands(self, community_cards):
-        """Evaluate all players' hands and return results"""
+        """Evaluate all players' hands and return results (cached until a card changes)"""
+        key = self._cache_key(community_cards)
+        cached_key, cached_results = self._evaluation_cache
+        if key == cached_key:
+            return cached_results
+        
         results = []
-        for i in range(NUM_PLAYERS):
+        for i in range(self.num_players):
             hand_result = self.evaluate_player_hand(i, community_cards)
             results.append({
                 'player_index': i,
                 'player_name': self.names[i],
                 'hand_result': hand_result
             })
+        self._evaluation_cache = (key, results)
         return results
     
     def find_winners(self, community_cards):
-        """Find the winning player(s) and return detailed results"""
-        all_results = self.evaluate_all_hands(community_cards)
+        """Find the winning player(s) and return detailed results (cached until a card changes)"""
+        key = self._cache_key(community_cards)
+        cached_key, cached_winners = self._winners_cache
+        if key == cached_key:
+            return cached_winners
         
-        # Filter out players with no valid hand
-        valid_results = [r for r in all_results if r['hand_result'] is not None]
-        
-        if not valid_results:
-            return []
-        
-        # Find the best hand(s)
-        best_results = [valid_results[0]]
-        
-        for result in valid_results[1:]:
-            comparison = self.hand_evaluator.compare_hands(
-                result['hand_result'], 
-                best_results[0]['hand_result']
-            )
-            
-            if comparison > 0:  # This hand is better
-                best_results = [result]
-            elif comparison == 0:  # Tie
-                best_results.append(result)
+        winners = self._find_winners(community_cards)
+        self._winners_cache = (key, winners)
+        return winners
+    
+    def _find_winners(self, community_cards):
+        strengths = self.showdown_strengths(community_cards)
+        winners = best_players(strengths)
         
-        return best_results
\ No newline at end of file
+        # Only the winners need the full (rank, value, cards, description) result
+        best_results = []
+        for i in winners:
+            best_results.append({
+                'player_index': i,
+                'player_name': self.names[i],
+                'hand_result': self.evaluate_player_hand(i, community_cards)
+            })
+        return best_results
+    
+    def showdown_strengths(self, community_cards):
+        """Get one sortable integer strength per player (None = no valid hand)"""
+        board_codes = [card.code for card in community_cards if card.code is not None]
+        return [self.hand_evaluator.evaluate_codes(self.get_player_codes(i) + board_codes)
+                for i in range(self.num_players)]
+    
+    def rank_players(self, community_cards):
+        """Order players best to worst; each entry is a group of tied player indices"""
+        return rank_players(self.showdown_strengths(community_cards))
+    
+    def resolve_pots(self, community_cards, contributions, folded=()):
+        """
+        Resolve the main pot and any side pots
+        contributions: chips put in by each player; folded: indices of folded players
+        Returns: [{'amount', 'eligible', 'winners', 'payouts'}, ...]
+        """
+        pots = build_side_pots(contributions, folded)
+        return award_pots(pots, self.showdown_strengths(community_cards))
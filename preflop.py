@@ -0,0 +1,208 @@
+# preflop.py
+"""Precomputed preflop equity for the 169 hand classes, stored in a compact binary file"""
+
+import argparse
+import random
+import struct
+import sys
+import time
+from array import array
+from card_codes import NUM_CARDS, RANK_CHARS
+from constants import PREFLOP_PATH, PREFLOP_SAMPLES, PREFLOP_HEADS_UP_SAMPLES, MAX_SEATS, NUM_BOARD_CARDS
+from lookup_evaluator import evaluate
+from simulation_pool import SimulationPool, shard_seeds
+
+NUM_CLASSES = 169
+MAX_OPPONENTS = MAX_SEATS - 1
+
+# Classes sit on the 13x13 rank grid: pairs on the diagonal,
+# suited hands at (high, low) and offsuit hands at (low, high)
+def _class_of(first, second):
+    high, low = max(first >> 2, second >> 2), min(first >> 2, second >> 2)
+    if high == low or (first & 3) == (second & 3):
+        return high * 13 + low
+    return low * 13 + high
+
+# Two-card code pair (first * 52 + second) -> class, so lookups never branch
+CLASS_BY_PAIR = tuple(_class_of(first, second) if first != second else -1
+                      for first in range(NUM_CARDS) for second in range(NUM_CARDS))
+CLASS_COMBOS = tuple(tuple((first, second) for first in range(NUM_CARDS) for second in range(first + 1, NUM_CARDS)
+                           if CLASS_BY_PAIR[first * NUM_CARDS + second] == index)
+                     for index in range(NUM_CLASSES))
+
+# File: header, then float32 equity vs random hands (class x opponents),
+# then float32 heads-up equity (class x class), all little-endian
+MAGIC = b'PKRPRE\0\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHHHII')
+
+def hand_class(first, second):
+    """Class index (0-168) of two hole card codes"""
+    index = CLASS_BY_PAIR[first * NUM_CARDS + second]
+    if index < 0:
+        raise ValueError("Hole cards must be two different cards")
+    return index
+
+def class_name(index):
+    """'AA', 'AKs', 'T9o', ..."""
+    row, col = divmod(index, 13)
+    high, low = RANK_CHARS[max(row, col)].upper(), RANK_CHARS[min(row, col)].upper()
+    if row == col:
+        return high + low
+    return high + low + ('s' if row > col else 'o')
+
+def _hole_codes(cards):
+    """Accept Card objects (e.g. from Players.get_player_cards) or card codes"""
+    codes = [card if isinstance(card, int) else card.code for card in cards]
+    if len(codes) != 2 or None in codes:
+        raise ValueError("Preflop lookups need exactly two dealt hole cards")
+    return codes
+
+def _vs_random_task(hole, num_opponents, samples, seed):
+    """Equity of one hand against `num_opponents` random hands over random boards"""
+    rng = random.Random(seed)
+    deck = [code for code in range(NUM_CARDS) if code not in hole]
+    dealt = num_opponents * 2 + NUM_BOARD_CARDS
+    hole = list(hole)
+    share = 0.0
+    for _ in range(samples):
+        cards = rng.sample(deck, dealt)
+        board = cards[:NUM_BOARD_CARDS]
+        hero = evaluate(hole + board)
+        best = hero
+        tied = 1
+        for i in range(NUM_BOARD_CARDS, dealt, 2):
+            strength = evaluate(cards[i:i + 2] + board)
+            if strength > best:
+                best = strength
+                break
+            if strength == hero:
+                tied += 1
+        if best == hero:
+            share += 1 / tied
+    return share / samples
+
+def _heads_up_row_task(index, samples, seed):
+    """Equity of class `index` against every class from `index` on (mirror matchups are 0.5)"""
+    rng = random.Random(seed)
+    row = []
+    for other in range(index, NUM_CLASSES):
+        if other == index:
+            row.append(0.5)
+            continue
+        share = 0.0
+        for _ in range(samples):
+            hole = rng.choice(CLASS_COMBOS[index])
+            other_hole = rng.choice(CLASS_COMBOS[other])
+            while other_hole[0] in hole or other_hole[1] in hole:
+                other_hole = rng.choice(CLASS_COMBOS[other])
+            deck = [code for code in range(NUM_CARDS) if code not in hole and code not in other_hole]
+            board = rng.sample(deck, NUM_BOARD_CARDS)
+            strength = evaluate(list(hole) + board)
+            other_strength = evaluate(list(other_hole) + board)
+            if strength > other_strength:
+                share += 1.0
+            elif strength == other_strength:
+                share += 0.5
+        row.append(share / samples)
+    return row
+
+class PreflopTable:
+    """
+    vs_random[class * MAX_OPPONENTS + opponents - 1] and heads_up[class * NUM_CLASSES + other]
+    hold equities (win share, ties split) as float32
+    """
+    def __init__(self, vs_random, heads_up, samples=0, heads_up_samples=0):
+        if len(vs_random) != NUM_CLASSES * MAX_OPPONENTS or len(heads_up) != NUM_CLASSES * NUM_CLASSES:
+            raise ValueError("Preflop tables have the wrong size")
+        self.vs_random = vs_random
+        self.heads_up = heads_up
+        self.samples = samples
+        self.heads_up_samples = heads_up_samples
+
+    def equity(self, cards, opponents=1):
+        """Equity of two hole cards against `opponents` random hands"""
+        if not 1 <= opponents <= MAX_OPPONENTS:
+            raise ValueError(f"Opponents must be 1-{MAX_OPPONENTS}, got {opponents}")
+        first, second = _hole_codes(cards)
+        return self.vs_random[hand_class(first, second) * MAX_OPPONENTS + opponents - 1]
+
+    def matchup(self, cards, other_cards):
+        """Heads-up equity of one hand class against another (averaged over suits)"""
+        first, second = _hole_codes(cards)
+        other_first, other_second = _hole_codes(other_cards)
+        return self.heads_up[hand_class(first, second) * NUM_CLASSES + hand_class(other_first, other_second)]
+
+    def save(self, path=PREFLOP_PATH):
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, NUM_CLASSES, MAX_OPPONENTS, 0,
+                                self.samples, self.heads_up_samples))
+            for table in (self.vs_random, self.heads_up):
+                data = array('f', table)
+                if sys.byteorder == 'big':
+                    data.byteswap()
+                data.tofile(f)
+
+    @classmethod
+    def load(cls, path=PREFLOP_PATH):
+        """Read a table written by save(); raises ValueError for a foreign or truncated file"""
+        with open(path, 'rb') as f:
+            data = f.read(HEADER.size)
+            if len(data) < HEADER.size:
+                raise ValueError(f"{path} is not a preflop table")
+            magic, version, num_classes, max_opponents, _, samples, heads_up_samples = HEADER.unpack(data)
+            if magic != MAGIC or version != VERSION or num_classes != NUM_CLASSES or max_opponents != MAX_OPPONENTS:
+                raise ValueError(f"{path} is not a version {VERSION} preflop table")
+            tables = []
+            for size in (NUM_CLASSES * MAX_OPPONENTS, NUM_CLASSES * NUM_CLASSES):
+                table = array('f')
+                try:
+                    table.fromfile(f, size)
+                except EOFError:
+                    raise ValueError(f"{path} is truncated")
+                if sys.byteorder == 'big':
+                    table.byteswap()
+                tables.append(table)
+        return cls(tables[0], tables[1], samples, heads_up_samples)
+
+def generate(pool, samples=PREFLOP_SAMPLES, heads_up_samples=PREFLOP_HEADS_UP_SAMPLES):
+    """
+    Simulate both tables on a SimulationPool
+    Every task has its own seed from pool.seed, so results do not depend on the worker count
+    """
+    # Equity against random hands is the same for every suit combination of a class
+    tasks = [(CLASS_COMBOS[index][0], opponents, samples)
+             for index in range(NUM_CLASSES) for opponents in range(1, MAX_OPPONENTS + 1)]
+    seeds = shard_seeds(pool.seed, len(tasks) + NUM_CLASSES)
+    vs_random = pool.map_tasks(_vs_random_task, [task + (seed,) for task, seed in zip(tasks, seeds)])
+
+    rows = pool.map_tasks(_heads_up_row_task, [(index, heads_up_samples, seeds[len(tasks) + index])
+                                               for index in range(NUM_CLASSES)])
+    heads_up = [0.0] * (NUM_CLASSES * NUM_CLASSES)
+    for index, row in enumerate(rows):
+        for offset, equity in enumerate(row):
+            other = index + offset
+            heads_up[index * NUM_CLASSES + other] = equity
+            heads_up[other * NUM_CLASSES + index] = 1.0 - equity
+    return PreflopTable(array('f', vs_random), array('f', heads_up), samples, heads_up_samples)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the preflop equity tables')
+    parser.add_argument('-o', '--output', default=PREFLOP_PATH, help='Table file to write')
+    parser.add_argument('-n', '--samples', type=int, default=PREFLOP_SAMPLES, help='Runouts per class and opponent count')
+    parser.add_argument('--heads-up-samples', type=int, default=PREFLOP_HEADS_UP_SAMPLES, help='Runouts per heads-up matchup')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='Worker processes')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Seed for reproducible tables')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with SimulationPool(args.workers, args.seed) as pool:
+        table = generate(pool, args.samples, args.heads_up_samples)
+    table.save(args.output)
+    print(f"Wrote {args.output} in {time.perf_counter() - start:.1f}s")
+    for index in (12 * 13 + 12, 12 * 13 + 11, 11 * 13 + 12, 0 * 13 + 5):
+        combo = CLASS_COMBOS[index][0]
+        print(f"{class_name(index):4s} vs 1: {table.equity(combo):.3f}  vs {MAX_OPPONENTS}: {table.equity(combo, MAX_OPPONENTS):.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# profiler.py
+"""Per-frame phase timings with rolling histograms and periodic JSON dumps"""
+
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+from constants import PROFILE_HISTORY, PROFILE_BUCKETS_MS, PROFILE_DUMP_PATH, PROFILE_DUMP_INTERVAL_MS
+from hand_evaluator import HandEvaluator
+
+# Phases are named like 'render/board'; top-level phases have no slash
+FRAME = 'frame'
+EVALUATIONS = 'evaluate_hand_calls'
+
+class _Section:
+    """Context manager adding its elapsed time to one phase of the current frame"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed_ms
+        return False
+
+class FrameProfiler:
+    def __init__(self, enabled=False, history=PROFILE_HISTORY, dump_path=PROFILE_DUMP_PATH,
+                 dump_interval_ms=PROFILE_DUMP_INTERVAL_MS):
+        self.enabled = enabled
+        self.history = history
+        self.dump_path = dump_path
+        self.dump_interval_ms = dump_interval_ms
+        self.samples = {}  # phase -> deque of per-frame values
+        self.current = {}
+        self.frames = 0
+        self._frame_start = None
+        self._calls_at_start = 0
+        self._last_dump = time.perf_counter()
+        self._null = nullcontext()
+
+    def toggle(self):
+        """Switch profiling on or off; history is kept"""
+        self.enabled = not self.enabled
+        self._frame_start = None
+
+    def section(self, name):
+        """Time a block as phase `name` of the current frame (a no-op while disabled)"""
+        if not self.enabled:
+            return self._null
+        return _Section(self, name)
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.current = {}
+        self._calls_at_start = HandEvaluator.evaluate_calls
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Store the finished frame and dump to disk when the interval has passed"""
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        self.current[FRAME] = (now - self._frame_start) * 1000
+        self.current[EVALUATIONS] = HandEvaluator.evaluate_calls - self._calls_at_start
+        for name, value in self.current.items():
+            phase = self.samples.get(name)
+            if phase is None:
+                phase = self.samples[name] = deque(maxlen=self.history)
+            phase.append(value)
+        self.frames += 1
+
+        if self.dump_path and (now - self._last_dump) * 1000 >= self.dump_interval_ms:
+            self.dump()
+            self._last_dump = now
+
+    def histogram(self, name, buckets=PROFILE_BUCKETS_MS):
+        """
+        Bucket the recent values of one phase
+        Returns: list of counts, one per bucket upper bound plus one for anything larger
+        """
+        counts = [0] * (len(buckets) + 1)
+        for value in self.samples.get(name, ()):
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def summary(self):
+        """
+        Statistics over the rolling window
+        Returns: dict of phase -> {'mean', 'p50', 'p95', 'max'}
+        """
+        stats = {}
+        for name, values in self.samples.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            stats[name] = {
+                'mean': sum(ordered) / len(ordered),
+                'p50': ordered[len(ordered) // 2],
+                'p95': ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)],
+                'max': ordered[-1],
+            }
+        return stats
+
+    def dump(self, path=None):
+        """Write the summary and histograms as JSON"""
+        report = {
+            'frames': self.frames,
+            'window': self.history,
+            'buckets_ms': list(PROFILE_BUCKETS_MS),
+            'phases': self.summary(),
+            'histograms': {name: self.histogram(name) for name in self.samples if name != EVALUATIONS},
+        }
+        with open(path or self.dump_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def overlay_lines(self):
+        """Short text lines for the on-screen overlay, slowest phases first"""
+        stats = self.summary()
+        if FRAME not in stats:
+            return ["Profiler: collecting..."]
+        lines = [f"Frame {stats[FRAME]['mean']:.2f}ms (p95 {stats[FRAME]['p95']:.2f}) | "
+                 f"evals/frame {stats[EVALUATIONS]['mean']:.1f}"]
+        phases = sorted((name for name in stats if name not in (FRAME, EVALUATIONS)),
+                        key=lambda name: -stats[name]['mean'])
+        for name in phases:
+            lines.append(f"{name}: {stats[name]['mean']:.2f}ms (p95 {stats[name]['p95']:.2f})")
+        return lines
@@ -0,0 +1,86 @@
+# renderer.py
+"""Retained-mode renderer that repaints only the regions that changed"""
+
+import pygame
+
+class DrawList:
+    """Stands in for the screen during a frame, recording blits instead of drawing"""
+    def __init__(self):
+        self.commands = []
+
+    def blit(self, source, dest):
+        """Record a blit; dest is a position or a Rect, as with Surface.blit"""
+        rect = pygame.Rect(dest[0], dest[1], source.get_width(), source.get_height())
+        self.commands.append((source, rect))
+        return rect
+
+class DirtyRenderer:
+    def __init__(self, screen, bg_color):
+        self.screen = screen
+        self.bg_color = bg_color
+        self.draw_list = DrawList()
+        self.previous = None  # Last frame's (source, rect) commands; None forces a full redraw
+
+    def begin_frame(self):
+        """Start recording a frame; draw onto the returned DrawList"""
+        self.draw_list.commands = []
+        return self.draw_list
+
+    def end_frame(self):
+        """
+        Repaint what changed since the last frame and push it to the display
+        Returns: the list of updated rects (empty when nothing changed)
+        """
+        commands = self.draw_list.commands
+        screen_rect = self.screen.get_rect()
+
+        if self.previous is None:
+            dirty = [screen_rect]
+        else:
+            dirty = self._changed_rects(self.previous, commands, screen_rect)
+
+        if dirty:
+            self._repaint(commands, dirty)
+            pygame.display.update(dirty)
+
+        # Keep the sources alive so their ids stay unique until the next diff
+        self.previous = commands
+        return dirty
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (e.g. after the window was exposed)"""
+        self.previous = None
+
+    def _changed_rects(self, previous, commands, screen_rect):
+        """Rects of blits that appeared, disappeared or moved, merged where they overlap"""
+        before = {(id(source), tuple(rect)): rect for source, rect in previous}
+        after = {(id(source), tuple(rect)): rect for source, rect in commands}
+
+        changed = [rect for key, rect in before.items() if key not in after]
+        changed += [rect for key, rect in after.items() if key not in before]
+
+        merged = []
+        for rect in changed:
+            rect = rect.clip(screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            i = 0
+            while i < len(merged):
+                if merged[i].colliderect(rect):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged
+
+    def _repaint(self, commands, dirty):
+        """Clear each dirty rect and redraw every blit that touches it, in order"""
+        screen = self.screen
+        for rect in dirty:
+            screen.set_clip(rect)
+            screen.fill(self.bg_color, rect)
+            for source, dest in commands:
+                if dest.colliderect(rect):
+                    screen.blit(source, dest)
+        screen.set_clip(None)
@@ -0,0 +1,62 @@
+# scheduler.py
+"""Adaptive frame pacing: full rate while active, throttled or asleep when idle"""
+
+import pygame
+from constants import FPS, IDLE_FPS, LOGIC_HZ, ACTIVE_WINDOW_MS, SLEEP_AFTER_MS, MAX_CATCHUP_TICKS
+
+ACTIVE = 'active'
+IDLE = 'idle'
+SLEEPING = 'sleeping'
+
+class FrameScheduler:
+    def __init__(self):
+        self.clock = pygame.time.Clock()
+        self.logic_step_ms = 1000 / LOGIC_HZ
+        self.accumulator_ms = 0.0
+        self.last_activity_ms = pygame.time.get_ticks()
+        self.last_frame_ms = self.last_activity_ms
+    
+    def mark_active(self):
+        """Input arrived (or an animation started): go back to full rate"""
+        self.last_activity_ms = pygame.time.get_ticks()
+    
+    def get_mode(self):
+        """ACTIVE, IDLE or SLEEPING depending on time since the last activity"""
+        quiet_ms = pygame.time.get_ticks() - self.last_activity_ms
+        if quiet_ms < ACTIVE_WINDOW_MS:
+            return ACTIVE
+        if quiet_ms < SLEEP_AFTER_MS:
+            return IDLE
+        return SLEEPING
+    
+    def should_block(self):
+        """Whether the loop should sleep on the event queue"""
+        return self.get_mode() == SLEEPING
+    
+    def wait(self):
+        """
+        Pace the loop at the rate for the current mode; returns elapsed ms
+        Idle frames sleep on the event queue instead, so input ends the sleep at once
+        """
+        if self.get_mode() == ACTIVE:
+            elapsed_ms = self.clock.tick(FPS)
+        else:
+            timeout_ms = 1000 // IDLE_FPS - (pygame.time.get_ticks() - self.last_frame_ms)
+            if timeout_ms > 0 and not pygame.event.peek():
+                event = pygame.event.wait(timeout_ms)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)  # Leave it for the next handle_events()
+            elapsed_ms = self.clock.tick()
+        self.last_frame_ms = pygame.time.get_ticks()
+        self.accumulator_ms += elapsed_ms
+        return elapsed_ms
+    
+    def logic_steps(self):
+        """Number of fixed logic ticks due since the last call"""
+        steps = int(self.accumulator_ms // self.logic_step_ms)
+        self.accumulator_ms -= steps * self.logic_step_ms
+        if steps > MAX_CATCHUP_TICKS:
+            # Time spent asleep or stalled is dropped rather than replayed
+            steps = MAX_CATCHUP_TICKS
+            self.accumulator_ms = 0.0
+        return steps
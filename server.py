@@ -0,0 +1,155 @@
+# server.py
+"""Asyncio table server: newline-delimited JSON over a local TCP or Unix socket"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from canonical import EquityCache
+from card_codes import type_from_code
+from constants import NUM_PLAYERS, SERVER_HOST, SERVER_PORT, EQUITY_SAMPLES
+from equity import calculate_equity
+from hand_evaluator import HandRank
+from lookup_evaluator import strength_category
+from showdown import showdown_codes
+from table import TableManager
+
+# Requests are one JSON object per line, e.g. {"cmd": "advance", "table": 0}
+# Replies echo "id" when given and carry "ok" plus the command's fields
+
+
+def evaluate_showdown(hole_cards, board):
+    """Executor job: strengths, winners and hand names for complete hands"""
+    strengths, winners = showdown_codes(hole_cards, board)
+    hands = [HandRank(strength_category(strength)).name for strength in strengths]
+    return strengths, winners, hands
+
+
+class TableServer:
+    def __init__(self, executor=None):
+        self.tables = TableManager(num_tables=0)
+        self.executor = executor or ProcessPoolExecutor()
+        # Shared by every table: suit-isomorphic spots reuse one result
+        self.equity_cache = EquityCache()
+
+    def _int_field(self, request, name, default, minimum=None):
+        """Read an optional integer field, rejecting other types before they reach the table logic"""
+        value = request.get(name, default)
+        if value is None and default is None:
+            return None
+        if not isinstance(value, int) or isinstance(value, bool) or (minimum is not None and value < minimum):
+            raise ValueError(f"'{name}' must be an integer" + (f" >= {minimum}" if minimum is not None else ""))
+        return value
+
+    def _table(self, request):
+        index = request.get('table')
+        if not isinstance(index, int) or not 0 <= index < len(self.tables):
+            raise ValueError(f"Unknown table: {index}")
+        return self.tables[index]
+
+    def _state(self, table):
+        players = table.players
+        return {
+            'stage': table.poker_stage,
+            'hole_cards': [[type_from_code(code) for code in players.get_player_codes(i)]
+                           for i in range(players.num_players)],
+            'board': [type_from_code(code) for code in table.board.get_codes()],
+        }
+
+    async def dispatch(self, request):
+        """Run one command and return its reply fields"""
+        command = request.get('cmd')
+
+        if command == 'open_table':
+            index = self.tables.add_table(self._int_field(request, 'seats', NUM_PLAYERS))
+            return {'table': index}
+
+        table = self._table(request)
+        if command == 'deal':
+            table.new_hand()
+            return self._state(table)
+        elif command == 'advance':
+            advanced = table.advance_stage()
+            return dict(self._state(table), advanced=advanced)
+        elif command == 'reset':
+            table.reset_board()
+            return self._state(table)
+        elif command == 'state':
+            return self._state(table)
+        elif command == 'showdown':
+            if table.poker_stage < 3:
+                raise ValueError("Showdown needs all five board cards")
+            hole_cards = [table.players.get_player_codes(i) for i in range(table.players.num_players)]
+            loop = asyncio.get_running_loop()
+            strengths, winners, hands = await loop.run_in_executor(
+                self.executor, evaluate_showdown, hole_cards, table.board.get_codes())
+            return {'strengths': strengths, 'winners': winners, 'hands': hands}
+        elif command == 'equity':
+            hole_cards = [table.players.get_player_codes(i) for i in range(table.players.num_players)]
+            samples = self._int_field(request, 'samples', EQUITY_SAMPLES, minimum=1)
+            seed = self._int_field(request, 'seed', None)
+            cache = self.equity_cache
+            key, canonical_hole, canonical_board = cache.key(hole_cards, table.board.get_codes(), samples, seed)
+            results = cache.get(key)
+            if results is None:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    self.executor, calculate_equity, [list(hole) for hole in canonical_hole],
+                    list(canonical_board), samples, seed)
+                cache.put(key, results)
+            return {'equity': results}
+        raise ValueError(f"Unknown command: {command}")
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection until it closes"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = {}
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Request must be a JSON object")
+                    if 'id' in request:
+                        reply['id'] = request['id']
+                    reply.update(await self.dispatch(request))
+                    reply['ok'] = True
+                except (ValueError, IndexError) as e:
+                    reply.update(ok=False, error=str(e))
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=SERVER_HOST, port=SERVER_PORT, unix_path=None):
+        """Listen until cancelled; a unix_path selects a Unix socket instead of TCP"""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"Table server listening on {unix_path or f'{host}:{port}'}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve poker tables over a local socket')
+    parser.add_argument('--host', default=SERVER_HOST, help='TCP address to bind')
+    parser.add_argument('--port', type=int, default=SERVER_PORT, help='TCP port to bind')
+    parser.add_argument('--unix', default=None, help='Unix socket path (instead of TCP)')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='Evaluation worker processes')
+    args = parser.parse_args(argv)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        server = TableServer(executor)
+        try:
+            asyncio.run(server.serve(args.host, args.port, args.unix))
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
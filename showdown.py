@@ -0,0 +1,98 @@
+# showdown.py
+"""Showdown ranking and side-pot resolution over integer hand strengths"""
+
+from lookup_evaluator import evaluate
+
+
+def rank_players(strengths):
+    """
+    Order players best to worst in one sort
+    strengths: one strength per player (None = no valid hand)
+    Returns: list of player-index groups; players in a group are tied
+    """
+    ordered = sorted((s, i) for i, s in enumerate(strengths) if s is not None)
+    groups = []
+    previous = None
+    for strength, index in reversed(ordered):
+        if groups and strength == previous:
+            groups[-1].append(index)
+        else:
+            groups.append([index])
+            previous = strength
+    for group in groups:
+        group.sort()
+    return groups
+
+
+def showdown_codes(hole_cards, board):
+    """
+    Show down complete hands given as card codes
+    Returns: (strengths, winners) with one strength per hand
+    """
+    board = list(board)
+    strengths = [evaluate(list(hole) + board) for hole in hole_cards]
+    return strengths, best_players(strengths)
+
+
+def best_players(strengths, eligible=None):
+    """Indices of the strongest hand(s) among `eligible` players (all by default)"""
+    if eligible is None:
+        eligible = range(len(strengths))
+    best = None
+    winners = []
+    for i in eligible:
+        strength = strengths[i]
+        if strength is None:
+            continue
+        if best is None or strength > best:
+            best = strength
+            winners = [i]
+        elif strength == best:
+            winners.append(i)
+    return winners
+
+
+def build_side_pots(contributions, folded=()):
+    """
+    Split chip contributions into a main pot and side pots
+    contributions: chips put in by each player; folded: indices of folded players
+    Returns: [{'amount', 'eligible'}, ...] from main pot outward
+    """
+    folded = set(folded)
+    levels = sorted(set(c for c in contributions if c > 0))
+    pots = []
+    previous_level = 0
+    for level in levels:
+        amount = sum(min(c, level) - min(c, previous_level) for c in contributions)
+        eligible = [i for i, c in enumerate(contributions) if c >= level and i not in folded]
+        previous_level = level
+
+        # Chips nobody live can win, or a layer with the same players, join the pot below
+        if pots and (not eligible or eligible == pots[-1]['eligible']):
+            pots[-1]['amount'] += amount
+        else:
+            pots.append({'amount': amount, 'eligible': eligible})
+    return pots
+
+
+def award_pots(pots, strengths):
+    """
+    Resolve the winners of every pot
+    Returns: the pots with 'winners' and 'payouts' ({player_index: chips}) added;
+    odd chips go to the earliest seats among the winners
+    """
+    awarded = []
+    for pot in pots:
+        winners = best_players(strengths, pot['eligible'])
+        payouts = {}
+        if winners:
+            share, odd_chips = divmod(pot['amount'], len(winners))
+            for n, i in enumerate(winners):
+                payouts[i] = share + (1 if n < odd_chips else 0)
+        awarded.append({
+            'amount': pot['amount'],
+            'eligible': pot['eligible'],
+            'winners': winners,
+            'payouts': payouts,
+        })
+    return awarded
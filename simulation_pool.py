@@ -0,0 +1,188 @@
+# simulation_pool.py
+"""Process pool for equity runs and bulk showdown simulation"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from constants import EQUITY_SAMPLES, EQUITY_EXACT_LIMIT, NUM_BOARD_CARDS, NUM_PLAYER_CARDS
+from equity import remaining_deck, sampled_runouts, count_outcomes, summarize, is_exact, calculate_equity_batch
+from lookup_evaluator import strength_category
+from showdown import showdown_codes
+
+
+def shard_seeds(seed, num_shards):
+    """Independent RNG seeds for each shard, derived only from `seed`"""
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(num_shards)]
+
+
+def shard_sizes(total, num_shards):
+    """Split `total` items as evenly as possible over the shards"""
+    base, extra = divmod(total, num_shards)
+    return [base + (1 if i < extra else 0) for i in range(num_shards)]
+
+
+def _equity_exact_shard(hole_cards, board, runouts):
+    return count_outcomes(hole_cards, board, runouts)
+
+
+def _equity_sampled_shard(hole_cards, board, samples, shard_seed):
+    deck = remaining_deck(hole_cards, board)
+    needed = NUM_BOARD_CARDS - len(board)
+    runouts = sampled_runouts(deck, needed, samples, random.Random(shard_seed))
+    return count_outcomes(hole_cards, board, runouts)
+
+
+def _showdown_shard(deals):
+    """Strengths and winner indices for complete (hole_cards, board) deals"""
+    return [showdown_codes(hole_cards, board) for hole_cards, board in deals]
+
+
+def _simulate_shard(num_hands, num_players, shard_seed):
+    """Deal and show down random hands, tallying wins and hand categories"""
+    rng = random.Random(shard_seed)
+    deck = list(range(52))
+    dealt = num_players * NUM_PLAYER_CARDS + NUM_BOARD_CARDS
+    wins = [0] * num_players
+    ties = [0] * num_players
+    categories = [0] * 11
+    for _ in range(num_hands):
+        cards = rng.sample(deck, dealt)
+        board = cards[-NUM_BOARD_CARDS:]
+        hole_cards = [cards[p * NUM_PLAYER_CARDS:(p + 1) * NUM_PLAYER_CARDS] for p in range(num_players)]
+        strengths, winners = showdown_codes(hole_cards, board)
+        best = strengths[winners[0]]
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+        else:
+            for p in winners:
+                ties[p] += 1
+        categories[strength_category(best)] += 1
+    return wins, ties, categories
+
+
+def _merge_outcomes(parts):
+    """Sum equity count tuples in shard order"""
+    wins, ties, losses, shares, total = parts[0]
+    wins, ties, losses, shares = list(wins), list(ties), list(losses), list(shares)
+    for part_wins, part_ties, part_losses, part_shares, part_total in parts[1:]:
+        for i in range(len(wins)):
+            wins[i] += part_wins[i]
+            ties[i] += part_ties[i]
+            losses[i] += part_losses[i]
+            shares[i] += part_shares[i]
+        total += part_total
+    return wins, ties, losses, shares, total
+
+
+class SimulationPool:
+    """
+    Shards simulations across worker processes
+    Results depend only on (seed, workers), never on scheduling order
+    """
+    def __init__(self, workers=None, seed=0):
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes"""
+        self.executor.shutdown()
+
+    def equity(self, hole_cards, board=(), samples=EQUITY_SAMPLES, exact_limit=EQUITY_EXACT_LIMIT):
+        """Sharded equivalent of equity.calculate_equity"""
+        hole_cards = [list(hole) for hole in hole_cards]
+        board = list(board)
+
+        if is_exact(hole_cards, board, exact_limit):
+            deck = remaining_deck(hole_cards, board)
+            runouts = list(combinations(deck, NUM_BOARD_CARDS - len(board)))
+            sizes = shard_sizes(len(runouts), self.workers)
+            futures = []
+            start = 0
+            for size in sizes:
+                futures.append(self.executor.submit(_equity_exact_shard, hole_cards, board, runouts[start:start + size]))
+                start += size
+        else:
+            sizes = shard_sizes(samples, self.workers)
+            seeds = shard_seeds(self.seed, self.workers)
+            futures = [self.executor.submit(_equity_sampled_shard, hole_cards, board, size, shard_seed)
+                       for size, shard_seed in zip(sizes, seeds)]
+
+        return summarize(_merge_outcomes([future.result() for future in futures]))
+
+    def equity_batch(self, tables, samples=EQUITY_SAMPLES, exact_limit=EQUITY_EXACT_LIMIT):
+        """
+        Equity for many tables, whole tables per worker
+        Same results as equity.calculate_equity_batch(tables, samples, self.seed, exact_limit)
+        """
+        tables = [([list(hole) for hole in hole_cards], list(board)) for hole_cards, board in tables]
+        futures = []
+        start = 0
+        for size in shard_sizes(len(tables), self.workers):
+            if size:
+                seed = None if self.seed is None else self.seed + start
+                futures.append(self.executor.submit(calculate_equity_batch, tables[start:start + size],
+                                                    samples, seed, exact_limit))
+            start += size
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def map_tasks(self, fn, tasks, chunksize=1):
+        """Run fn(*task) for every task on the workers; results come back in task order"""
+        return list(self.executor.map(fn, *zip(*tasks), chunksize=chunksize)) if tasks else []
+
+    def showdown_batch(self, deals):
+        """
+        Evaluate many complete deals in parallel
+        deals: list of (hole_cards, board); returns [(strengths, winners), ...] in order
+        """
+        deals = list(deals)
+        futures = []
+        start = 0
+        for size in shard_sizes(len(deals), self.workers):
+            futures.append(self.executor.submit(_showdown_shard, deals[start:start + size]))
+            start += size
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def simulate(self, num_hands, num_players):
+        """
+        Deal and show down `num_hands` random hands
+        Returns: dict with per-seat wins/ties and counts per HandRank value
+        """
+        sizes = shard_sizes(num_hands, self.workers)
+        seeds = shard_seeds(self.seed, self.workers)
+        futures = [self.executor.submit(_simulate_shard, size, num_players, shard_seed)
+                   for size, shard_seed in zip(sizes, seeds)]
+
+        wins = [0] * num_players
+        ties = [0] * num_players
+        categories = [0] * 11
+        for future in futures:
+            part_wins, part_ties, part_categories = future.result()
+            for p in range(num_players):
+                wins[p] += part_wins[p]
+                ties[p] += part_ties[p]
+            for c in range(len(categories)):
+                categories[c] += part_categories[c]
+
+        return {
+            'hands': num_hands,
+            'wins': wins,
+            'ties': ties,
+            'categories': {c: categories[c] for c in range(1, 11)},
+        }
@@ -0,0 +1,174 @@
+# table.py
+"""Pure-logic poker table: deck, board and players without pygame"""
+
+from board import Board
+from card_codes import type_from_code
+from constants import NUM_PLAYERS, NUM_TABLES
+from deck import Deck
+from hand_evaluator import HandEvaluator
+from players import Players
+from showdown import best_players
+
+RANDOM = 'random'
+
+class Table:
+    def __init__(self, asset_manager=None, seed=None, num_players=NUM_PLAYERS, hand_evaluator=None,
+                 recorder=None, table_id=0):
+        self.recorder = recorder  # Optional HandRecorder logging every hand
+        self.table_id = table_id
+        self.deck = Deck(seed=seed)
+        self.deck.shuffle()
+        self.players = Players(asset_manager, deck=self.deck, num_players=num_players, hand_evaluator=hand_evaluator)
+        self.board = Board(asset_manager, deck=self.deck)
+        self.poker_stage = 0  # 0: not started, 1: first 3 cards, 2: fourth card, 3: fifth card
+        self.initial_deal = True  # The constructor's deal is still untouched; play_hand() plays it
+        self._begin_record()
+
+    def new_hand(self):
+        """Shuffle and deal fresh hole cards with an empty board"""
+        self.finish_record()
+        self.initial_deal = False
+        self.deck.shuffle()
+        for card in self.board.cards:
+            card.set_type('base')
+        self.players.deal_new_hand()
+        self.board.mark_deck()
+        self.poker_stage = 0
+        self._begin_record()
+
+    def show_hand(self, hole_cards, board_codes, stage):
+        """
+        Replace the current hand with given cards (e.g. a recorded one)
+        The deck is restacked without them, so later streets and resets never deal duplicates
+        hole_cards: one list of codes per seat; board_codes: one code (or None) per board position
+        """
+        self.finish_record()
+        self.initial_deal = False
+        dealt = [code for hole in hole_cards for code in hole if code is not None]
+        opened = [code for code in board_codes if code is not None]
+        self.deck.stack(dealt + opened)
+
+        for i, code in enumerate(code for hole in hole_cards for code in hole):
+            self.players.set_card_type(i, 'base' if code is None else type_from_code(code))
+        self.deck.deal_many(len(dealt))
+        self.board.mark_deck()
+        for i, code in enumerate(board_codes):
+            self.board.set_card_type(i, 'base' if code is None else type_from_code(code))
+        self.deck.deal_many(len(opened))
+
+        self.poker_stage = stage
+        self._begin_record()
+        if self.recorder is not None:
+            for opened_stage in range(1, stage + 1):
+                self.recorder.stage(self.table_id, opened_stage)
+
+    def advance_stage(self):
+        """Open the next street; returns False once the river is out"""
+        if self.poker_stage >= 3:
+            return False
+        self.poker_stage += 1
+        self.initial_deal = False
+        self.board.next_card(self.poker_stage, RANDOM)
+        if self.recorder is not None:
+            self.recorder.stage(self.table_id, self.poker_stage)
+        return True
+
+    def reset_board(self):
+        """Clear the board, keeping the players' hole cards"""
+        self.stage_changed(0)
+        self.board.reset_board()
+
+    def stage_changed(self, stage):
+        """
+        Follow a stage change made on the board directly (InputHandler drives the game this way)
+        Going back to stage 0 ends the hand, so call it before the board is cleared;
+        the same hole cards start the next one
+        """
+        self.initial_deal = False
+        if stage == 0:
+            self.finish_record()
+            self.poker_stage = 0
+            self._begin_record()
+            return
+        self.poker_stage = stage
+        if self.recorder is not None:
+            self.recorder.stage(self.table_id, stage)
+
+    def _begin_record(self):
+        if self.recorder is not None:
+            hole_cards = [self.players.get_player_codes(i) for i in range(self.players.num_players)]
+            self.recorder.begin(self.table_id, hole_cards)
+
+    def finish_record(self, strengths=None, winners=None):
+        """Log the hand in progress; a hand that reached the river records its winners"""
+        if self.recorder is None or self.table_id not in self.recorder.pending:
+            return None  # Nothing to log, e.g. showdown() already wrote this hand
+        if winners is None and self.poker_stage >= 3:
+            winners = [result['player_index'] for result in self.players.find_winners(self.board.cards)]
+            strengths = self.players.showdown_strengths(self.board.cards)
+        win_strength = strengths[winners[0]] if winners else None
+        board_codes = [card.code for card in self.board.cards]
+        return self.recorder.finish(self.table_id, board_codes, winners or (), win_strength)
+
+    def showdown(self):
+        """
+        Show down the current hand
+        Returns: (strengths, winners) with one strength per player
+        """
+        strengths = self.players.showdown_strengths(self.board.cards)
+        winners = best_players(strengths)
+        self.finish_record(strengths, winners)
+        return strengths, winners
+
+    def play_hand(self):
+        """Deal a new hand (or take the constructor's untouched one), run it out to the river and show down"""
+        if not self.initial_deal:
+            self.new_hand()
+        while self.advance_stage():
+            pass
+        return self.showdown()
+
+class TableManager:
+    """
+    Many independent tables in one process
+    Tables share one AssetManager, HandEvaluator and HandRecorder; each has its own deck and seed
+    """
+    def __init__(self, num_tables=NUM_TABLES, seats=NUM_PLAYERS, asset_manager=None, seed=None, recorder=None):
+        self.asset_manager = asset_manager
+        self.hand_evaluator = HandEvaluator()
+        self.recorder = recorder
+        self.seed = seed
+        self.tables = []
+        seats_per_table = seats if isinstance(seats, (list, tuple)) else [seats] * num_tables
+        for num_players in seats_per_table:
+            self.add_table(num_players)
+
+    def add_table(self, num_players=NUM_PLAYERS):
+        """Open a new table and return its index"""
+        index = len(self.tables)
+        seed = None if self.seed is None else self.seed + index
+        self.tables.append(Table(self.asset_manager, seed, num_players, self.hand_evaluator,
+                                 self.recorder, index))
+        return index
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __getitem__(self, index):
+        return self.tables[index]
+
+    def __iter__(self):
+        return iter(self.tables)
+
+    def advance_all(self):
+        """Open the next street on every table"""
+        return [table.advance_stage() for table in self.tables]
+
+    def play_hands(self):
+        """Play one complete hand on every table; returns (strengths, winners) per table"""
+        return [table.play_hand() for table in self.tables]
+
+    def finish_records(self):
+        """Log every table's hand in progress (call before closing the recorder)"""
+        for table in self.tables:
+            table.finish_record()
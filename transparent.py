@@ -1,8 +1,11 @@
 import cv2
 import numpy as np
-from PIL import Image
 import argparse
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 def is_green_pixel(pixel, tolerance=30, min_green=80, max_brightness=300):
     """
@@ -36,7 +39,38 @@ def is_green_pixel(pixel, tolerance=30, min_green=80, max_brightness=300):
         return is_green_dominant and is_green_enough and is_not_too_bright and is_significantly_green
     return False
 
-def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=80, max_brightness=300, preview=False):
+def green_mask(image, tolerance=30, min_green=80, max_brightness=300):
+    """
+    Vectorized is_green_pixel over a whole BGR/BGRA image.
+    
+    Args:
+        image: HxWx3 or HxWx4 uint8 array in BGR(A) order
+        tolerance, min_green, max_brightness: same meaning as is_green_pixel
+    
+    Returns:
+        numpy.ndarray: HxW boolean mask of green pixels
+    """
+    # Widen to int16 so sums and differences cannot overflow uint8
+    b = image[:, :, 0].astype(np.int16)
+    g = image[:, :, 1].astype(np.int16)
+    r = image[:, :, 2].astype(np.int16)
+    
+    mask = g > r + tolerance
+    mask &= g > b + tolerance
+    mask &= g > min_green
+    mask &= (r + g + b) < max_brightness
+    # g > (r + b) / 2 + tolerance, kept in integers
+    mask &= 2 * g > r + b + 2 * tolerance
+    return mask
+
+def checkerboard(height, width, checker_size=20):
+    """Light/dark gray checkerboard (HxWx3 uint8) used to preview transparency"""
+    rows = np.arange(height) // checker_size
+    cols = np.arange(width) // checker_size
+    light = (rows[:, None] + cols[None, :]) % 2 == 0
+    return np.where(light[:, :, None], 200, 150).astype(np.uint8).repeat(3, axis=2)
+
+def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=80, max_brightness=300, preview=False, verbose=True):
     """
     Convert green pixels to transparent in an image.
     
@@ -47,6 +81,7 @@ def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=8
         min_green: Minimum green value to consider (0-255)
         max_brightness: Maximum total RGB brightness to avoid white pixels (0-765)
         preview: Show before/after comparison
+        verbose: Print progress messages
     
     Returns:
         numpy.ndarray: Image with green pixels made transparent
@@ -57,7 +92,8 @@ def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=8
         raise ValueError(f"Could not load image from {input_path}")
     
     height, width = image.shape[:2]
-    print(f"Processing image: {width}x{height}")
+    if verbose:
+        print(f"Processing image: {width}x{height}")
     
     # Convert to RGBA if not already
     if len(image.shape) == 3 and image.shape[2] == 3:  # BGR
@@ -68,20 +104,16 @@ def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=8
     else:
         raise ValueError("Unsupported image format")
     
+    # Make every green pixel transparent in place
+    mask = green_mask(rgba_image, tolerance, min_green, max_brightness)
+    rgba_image[mask, 3] = 0
+    
     # Count green pixels for reporting
-    green_pixel_count = 0
+    green_pixel_count = int(np.count_nonzero(mask))
     total_pixels = height * width
     
-    # Process each pixel
-    for y in range(height):
-        for x in range(width):
-            pixel = rgba_image[y, x]
-            if is_green_pixel(pixel, tolerance, min_green, max_brightness):
-                # Make pixel transparent
-                rgba_image[y, x, 3] = 0  # Set alpha to 0 (transparent)
-                green_pixel_count += 1
-    
-    print(f"Made {green_pixel_count:,} pixels transparent ({green_pixel_count/total_pixels*100:.1f}% of image)")
+    if verbose:
+        print(f"Made {green_pixel_count:,} pixels transparent ({green_pixel_count/total_pixels*100:.1f}% of image)")
     
     # Save result
     if output_path:
@@ -89,34 +121,23 @@ def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=8
         name, ext = os.path.splitext(output_path)
         if ext.lower() != '.png':
             output_path = name + '.png'
-            print(f"Changed output format to PNG for transparency support: {output_path}")
+            if verbose:
+                print(f"Changed output format to PNG for transparency support: {output_path}")
         
-        # Convert BGRA to RGBA for saving with PIL (which handles transparency better)
-        rgba_pil = cv2.cvtColor(rgba_image, cv2.COLOR_BGRA2RGBA)
-        pil_image = Image.fromarray(rgba_pil)
-        pil_image.save(output_path, 'PNG')
-        print(f"Saved transparent image to: {output_path}")
+        # OpenCV writes the BGRA buffer straight to an RGBA PNG, no conversion needed
+        if not cv2.imwrite(output_path, rgba_image):
+            raise ValueError(f"Could not save image to {output_path}")
+        if verbose:
+            print(f"Saved transparent image to: {output_path}")
     
     # Show preview if requested
     if preview:
         # Create a checkerboard background to show transparency
-        checker_size = 20
-        checker = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        for y in range(0, height, checker_size):
-            for x in range(0, width, checker_size):
-                if ((y // checker_size) + (x // checker_size)) % 2 == 0:
-                    checker[y:y+checker_size, x:x+checker_size] = [200, 200, 200]  # Light gray
-                else:
-                    checker[y:y+checker_size, x:x+checker_size] = [150, 150, 150]  # Dark gray
+        checker = checkerboard(height, width)
         
         # Composite the transparent image over the checkerboard
-        alpha = rgba_image[:, :, 3] / 255.0
-        preview_image = checker.copy()
-        
-        for c in range(3):
-            preview_image[:, :, c] = (alpha * rgba_image[:, :, c] + 
-                                    (1 - alpha) * preview_image[:, :, c])
+        alpha = rgba_image[:, :, 3:4] / 255.0
+        preview_image = (alpha * rgba_image[:, :, :3] + (1 - alpha) * checker).astype(np.uint8)
         
         # Resize for display if too large
         max_height = 600
@@ -138,9 +159,42 @@ def green_to_transparent(input_path, output_path=None, tolerance=30, min_green=8
     
     return rgba_image
 
-def batch_process(input_folder, output_folder=None, tolerance=30, min_green=80, max_brightness=300):
+MANIFEST_NAME = '.transparent_manifest.json'
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_manifest(output_folder):
+    """Load the {filename: {hash, params, output}} record of earlier runs"""
+    path = os.path.join(output_folder, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(output_folder, manifest):
+    path = os.path.join(output_folder, MANIFEST_NAME)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def _process_file(input_path, output_path, tolerance, min_green, max_brightness):
+    """Worker: key one file and return how long it took"""
+    start = time.perf_counter()
+    green_to_transparent(input_path, output_path, tolerance, min_green, max_brightness, verbose=False)
+    return time.perf_counter() - start
+
+def batch_process(input_folder, output_folder=None, tolerance=30, min_green=80, max_brightness=300,
+                  workers=None, max_in_flight=None, force=False):
     """
-    Process multiple images in a folder.
+    Process multiple images in a folder in parallel, skipping unchanged ones.
     
     Args:
         input_folder: Folder containing input images
@@ -148,6 +202,9 @@ def batch_process(input_folder, output_folder=None, tolerance=30, min_green=80,
         tolerance: Green detection tolerance
         min_green: Minimum green value
         max_brightness: Maximum brightness to avoid white pixels
+        workers: Number of worker processes (default: CPU count)
+        max_in_flight: Maximum images queued at once, bounding memory (default: 2 per worker)
+        force: Reprocess every image even if the manifest says it is up to date
     """
     if output_folder is None:
         output_folder = input_folder + "_transparent"
@@ -156,22 +213,70 @@ def batch_process(input_folder, output_folder=None, tolerance=30, min_green=80,
         os.makedirs(output_folder)
     
     supported_formats = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
-    processed = 0
+    params = [tolerance, min_green, max_brightness]
+    manifest = load_manifest(output_folder)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
     
-    for filename in os.listdir(input_folder):
-        if filename.lower().endswith(supported_formats):
-            input_path = os.path.join(input_folder, filename)
-            name, ext = os.path.splitext(filename)
-            output_path = os.path.join(output_folder, name + '_transparent.png')
+    # Work out which files actually need processing
+    jobs = []
+    skipped = 0
+    for filename in sorted(os.listdir(input_folder)):
+        if not filename.lower().endswith(supported_formats):
+            continue
+        input_path = os.path.join(input_folder, filename)
+        name, ext = os.path.splitext(filename)
+        output_name = name + '_transparent.png'
+        output_path = os.path.join(output_folder, output_name)
+        
+        digest = file_hash(input_path)
+        entry = manifest.get(filename)
+        if (not force and entry and entry['hash'] == digest and entry['params'] == params
+                and os.path.exists(output_path)):
+            skipped += 1
+            continue
+        jobs.append((filename, input_path, output_path, output_name, digest))
+    
+    timings = []
+    failed = 0
+    start = time.perf_counter()
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        queue = iter(jobs)
+        
+        while True:
+            # Keep at most max_in_flight images decoded or queued at once
+            for job in queue:
+                future = executor.submit(_process_file, job[1], job[2], tolerance, min_green, max_brightness)
+                pending[future] = job
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
             
-            try:
-                print(f"\nProcessing: {filename}")
-                green_to_transparent(input_path, output_path, tolerance, min_green, max_brightness)
-                processed += 1
-            except Exception as e:
-                print(f"Error processing {filename}: {e}")
-    
-    print(f"\nBatch processing complete. Processed {processed} images.")
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                filename, _, _, output_name, digest = pending.pop(future)
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    print(f"Error processing {filename}: {e}")
+                    manifest.pop(filename, None)
+                    failed += 1
+                    continue
+                manifest[filename] = {'hash': digest, 'params': params, 'output': output_name}
+                timings.append((elapsed, filename))
+    
+    save_manifest(output_folder, manifest)
+    wall_time = time.perf_counter() - start
+    
+    if timings:
+        print("\nPer-file timings (slowest first):")
+        for elapsed, filename in sorted(timings, reverse=True):
+            print(f"  {elapsed * 1000:8.1f} ms  {filename}")
+    print(f"\nBatch processing complete. Processed {len(timings)} images, "
+          f"skipped {skipped} unchanged, {failed} failed in {wall_time:.2f}s ({workers} worker processes).")
 
 def main():
     parser = argparse.ArgumentParser(description='Convert green pixels to transparent')
@@ -187,13 +292,18 @@ def main():
                        help='Show before/after preview')
     parser.add_argument('-b', '--batch', action='store_true',
                        help='Process all images in a folder')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                       help='Worker processes for batch mode (default: CPU count)')
+    parser.add_argument('-f', '--force', action='store_true',
+                       help='Reprocess unchanged images in batch mode')
     
     args = parser.parse_args()
     
     try:
         if args.batch or os.path.isdir(args.input):
             # Batch processing
-            batch_process(args.input, args.output, args.tolerance, args.min_green, args.max_brightness)
+            batch_process(args.input, args.output, args.tolerance, args.min_green, args.max_brightness,
+                          workers=args.workers, force=args.force)
         else:
             # Single image processing
             if not args.output:
@@ -218,6 +328,8 @@ if __name__ == "__main__":
         print("  --max-brightness  Maximum total brightness 0-765 (default: 200)")
         print("  -p, --preview     Show before/after comparison")
         print("  -b, --batch       Process all images in folder")
+        print("  -j, --workers     Worker processes for batch mode (default: CPU count)")
+        print("  -f, --force       Reprocess images the batch manifest marks as unchanged")
         print("")
         print("Examples:")
         print("  python green_transparent.py photo.jpg -p")
@@ -2,38 +2,59 @@
 """UI rendering and display"""
 
 import pygame
-from constants import SCREEN_HEIGHT, NAME_Y_OFFSET, PLAYER_POSITIONS_X, NUM_PLAYERS
+from collections import OrderedDict
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, NAME_Y_OFFSET, PLAYER_POSITIONS_X, CARD_DIMENSIONS, TEXT_CACHE_SIZE
 
 class UI:
     def __init__(self):
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        # (font, text, color) -> rendered surface, least recently used first
+        self.text_cache = OrderedDict()
     
-    def draw_debug_info(self, screen, ticks, input_timeout, poker_stage=0):
-        """Draw debug information to screen"""
-        ticks_text = self.font.render(f"Ticks: {ticks}", True, (255, 255, 255))
-        timeout_text = self.font.render(f"Timeout: {input_timeout}", True, (255, 255, 255))
-        stage_text = self.font.render(f"Poker Stage: {poker_stage}/3", True, (255, 255, 255))
+    def render_text(self, font, text, color):
+        """Render antialiased text, reusing the surface while the text is unchanged"""
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surface
+    
+    def draw_debug_info(self, screen, ticks, input_timeout, poker_stage=0, profile_lines=None):
+        """Draw debug information to screen, plus the profiler overlay when given its lines"""
+        ticks_text = self.render_text(self.font, f"Ticks: {ticks}", (255, 255, 255))
+        timeout_text = self.render_text(self.font, f"Timeout: {input_timeout}", (255, 255, 255))
+        stage_text = self.render_text(self.font, f"Poker Stage: {poker_stage}/3", (255, 255, 255))
         
         screen.blit(ticks_text, (10, 10))
         screen.blit(timeout_text, (10, 35))
         screen.blit(stage_text, (10, 60))
+        
+        for i, line in enumerate(profile_lines or ()):
+            profile_text = self.render_text(self.small_font, line, (255, 200, 0))
+            screen.blit(profile_text, (SCREEN_WIDTH - profile_text.get_width() - 10, 10 + i * 20))
     
     def draw_instructions(self, screen):
         """Draw game instructions"""
-        instruction_text = self.small_font.render("RIGHT: Next poker stage | LEFT: Previous stage", True, (255, 255, 255))
-        stage_info = self.small_font.render("Stage 1: Cards 1-3 | Stage 2: Card 4 | Stage 3: Card 5", True, (200, 200, 200))
-        hand_controls = self.small_font.render("H: Toggle hand evaluations | W: Show winners (after stage 3)", True, (200, 200, 200))
+        instruction_text = self.render_text(self.small_font, "RIGHT: Next poker stage | LEFT: Previous stage", (255, 255, 255))
+        stage_info = self.render_text(self.small_font, "Stage 1: Cards 1-3 | Stage 2: Card 4 | Stage 3: Card 5", (200, 200, 200))
+        hand_controls = self.render_text(self.small_font, "H: Toggle hand evaluations | W: Show winners (after stage 3) | P: Profiler", (200, 200, 200))
         screen.blit(instruction_text, (10, 100))
         screen.blit(stage_info, (10, 120))
         screen.blit(hand_controls, (10, 140))
 
-    def draw_player_names(self, screen, player_names):
+    def draw_player_names(self, screen, player_names, seat_positions=PLAYER_POSITIONS_X):
         """Draw player name at the bottom of screen"""
-        for i in range(NUM_PLAYERS):
-            name_text = self.font.render(player_names[i], True, (255, 255, 255))
+        for i in range(len(player_names)):
+            name_text = self.render_text(self.font, player_names[i], (255, 255, 255))
             text_rect = name_text.get_rect()
-            text_rect.centerx = PLAYER_POSITIONS_X[i][0] + 102
+            text_rect.centerx = (seat_positions[i][0] + seat_positions[i][1] + CARD_DIMENSIONS[0]) // 2
             text_rect.y = SCREEN_HEIGHT - NAME_Y_OFFSET
             screen.blit(name_text, (text_rect.x, text_rect.y))
     
@@ -57,13 +78,20 @@ class UI:
                 rank, value, best_cards, description = result['hand_result']
                 
                 # Position text near player cards
-                x_pos = PLAYER_POSITIONS_X[i][0]
+                x_pos = players.positions[i][0]
                 y_pos = SCREEN_HEIGHT - NAME_Y_OFFSET + 25
                 
                 # Draw hand description
-                hand_text = self.small_font.render(description, True, (255, 255, 0))
+                hand_text = self.render_text(self.small_font, description, (255, 255, 0))
                 screen.blit(hand_text, (x_pos, y_pos))
     
+    def draw_table_info(self, screen, table_index, num_tables):
+        """Draw which table is on screen when several are running"""
+        if num_tables < 2:
+            return
+        table_text = self.render_text(self.small_font, f"Table {table_index + 1}/{num_tables} | TAB: Next table", (200, 200, 200))
+        screen.blit(table_text, (10, 160))
+    
     def draw_winners(self, screen, winners):
         """Draw winner announcement"""
         if not winners:
@@ -79,8 +107,8 @@ class UI:
             hand_desc = winners[0]['hand_result'][3] if winners[0]['hand_result'] else "Unknown hand"
         
         # Draw winner announcement in center of screen
-        winner_surface = self.font.render(winner_text, True, (0, 255, 0))
-        hand_surface = self.small_font.render(hand_desc, True, (255, 255, 255))
+        winner_surface = self.render_text(self.font, winner_text, (0, 255, 0))
+        hand_surface = self.render_text(self.small_font, hand_desc, (255, 255, 255))
         
         winner_rect = winner_surface.get_rect(center=(650, 30))
         hand_rect = hand_surface.get_rect(center=(650, 70))